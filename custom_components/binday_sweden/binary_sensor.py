@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from abc import abstractmethod
+from collections.abc import Callable
+from datetime import date, datetime, time, timedelta
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_CREATE_PER_TYPE_SENSORS,
+    CONF_PER_TYPE_SENSOR_CAP,
+    CONF_REMINDER_TIME,
+    DEFAULT_CREATE_PER_TYPE_SENSORS,
+    DEFAULT_PER_TYPE_SENSOR_CAP,
+    DEFAULT_REMINDER_TIME,
+    DOMAIN,
+)
+from .coordinator import BinDayCoordinator
+from .providers import ProviderEvent
+from .util import slugify
+
+_Interval = tuple[datetime, datetime]
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    coordinator: BinDayCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    entities: list[BinarySensorEntity] = [
+        BinDayCollectionTodayBinarySensor(coordinator, entry),
+        BinDayCollectionTomorrowBinarySensor(coordinator, entry),
+        BinDayReminderBinarySensor(coordinator, entry),
+    ]
+
+    create_per_type = bool(
+        entry.options.get(CONF_CREATE_PER_TYPE_SENSORS, DEFAULT_CREATE_PER_TYPE_SENSORS)
+    )
+    if create_per_type and coordinator.data:
+        cap = int(entry.options.get(CONF_PER_TYPE_SENSOR_CAP, DEFAULT_PER_TYPE_SENSOR_CAP))
+        for type_key in _type_keys(coordinator.data.events)[: max(cap, 0)]:
+            entities.append(BinDayCollectionTodayBinarySensor(coordinator, entry, type_key))
+            entities.append(BinDayCollectionTomorrowBinarySensor(coordinator, entry, type_key))
+
+    async_add_entities(entities)
+
+
+def _type_keys(events: list[ProviderEvent]) -> list[str]:
+    today = dt_util.now().date()
+    first_seen: dict[str, date] = {}
+    for ev in events:
+        if ev.date < today:
+            continue
+        key = ev.type_key
+        if key not in first_seen or ev.date < first_seen[key]:
+            first_seen[key] = ev.date
+    return [k for k, _ in sorted(first_seen.items(), key=lambda kv: (kv[1], kv[0].lower()))]
+
+
+def _merge(intervals: list[_Interval]) -> list[_Interval]:
+    merged: list[_Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+            continue
+        merged.append((start, end))
+    return merged
+
+
+class _BinDayBaseBinarySensor(CoordinatorEntity[BinDayCoordinator], BinarySensorEntity):
+    """Binary sensor driven by point-in-time callbacks instead of polling.
+
+    Pickup dates are turned into "on" intervals whenever the coordinator
+    updates. A single timer is armed for the next interval boundary, so the
+    entity only wakes up when its state actually flips.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: BinDayCoordinator,
+        entry: ConfigEntry,
+        key: str,
+        type_key: str | None = None,
+    ) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._type_key = type_key
+        self._intervals: list[_Interval] = []
+        self._unsub_timer: Callable[[], None] | None = None
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": entry.title,
+        }
+
+        if type_key is None:
+            self._attr_unique_id = f"{entry.entry_id}_{key}"
+            self._attr_suggested_object_id = f"{coordinator.object_id_prefix}_{key}"
+        else:
+            type_slug = slugify(type_key)
+            self._attr_unique_id = f"{entry.entry_id}_type_{type_slug}_{key}"
+
+    @abstractmethod
+    def _interval_for(self, pickup: date) -> _Interval:
+        """Return the [start, end) window during which a pickup turns the sensor on."""
+
+    def _pickup_dates(self) -> set[date]:
+        data = self.coordinator.data
+        if not data:
+            return set()
+        return {
+            ev.date
+            for ev in data.events
+            if self._type_key is None or ev.type_key == self._type_key
+        }
+
+    @callback
+    def _async_rebuild(self) -> None:
+        # Pickups older than yesterday can no longer produce an "on" window.
+        cutoff = dt_util.now().date() - timedelta(days=1)
+        self._intervals = _merge(
+            [self._interval_for(d) for d in self._pickup_dates() if d >= cutoff]
+        )
+        self._async_update_state()
+
+    @callback
+    def _async_update_state(self) -> None:
+        now = dt_util.now()
+        self._attr_is_on = any(start <= now < end for start, end in self._intervals)
+
+        self._async_cancel_timer()
+        next_change = next(
+            (b for start, end in self._intervals for b in (start, end) if b > now),
+            None,
+        )
+        if next_change is not None:
+            self._unsub_timer = async_track_point_in_time(
+                self.hass, self._async_handle_transition, next_change
+            )
+
+    @callback
+    def _async_handle_transition(self, _now: datetime) -> None:
+        self._unsub_timer = None
+        self._async_update_state()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_timer)
+        self._async_rebuild()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._async_rebuild()
+        super()._handle_coordinator_update()
+
+
+class BinDayCollectionTodayBinarySensor(_BinDayBaseBinarySensor):
+    _attr_icon = "mdi:delete-clock"
+
+    def __init__(
+        self,
+        coordinator: BinDayCoordinator,
+        entry: ConfigEntry,
+        type_key: str | None = None,
+    ) -> None:
+        super().__init__(coordinator, entry, "collection_today", type_key)
+        self.entity_description = BinarySensorEntityDescription(
+            key="collection_today" if type_key is None else f"type_{slugify(type_key)}_collection_today",
+            name="Collection today" if type_key is None else f"{type_key} collection today",
+        )
+
+    def _interval_for(self, pickup: date) -> _Interval:
+        start = dt_util.start_of_local_day(pickup)
+        return start, dt_util.start_of_local_day(pickup + timedelta(days=1))
+
+
+class BinDayCollectionTomorrowBinarySensor(_BinDayBaseBinarySensor):
+    _attr_icon = "mdi:delete-clock-outline"
+
+    def __init__(
+        self,
+        coordinator: BinDayCoordinator,
+        entry: ConfigEntry,
+        type_key: str | None = None,
+    ) -> None:
+        super().__init__(coordinator, entry, "collection_tomorrow", type_key)
+        self.entity_description = BinarySensorEntityDescription(
+            key=(
+                "collection_tomorrow"
+                if type_key is None
+                else f"type_{slugify(type_key)}_collection_tomorrow"
+            ),
+            name="Collection tomorrow" if type_key is None else f"{type_key} collection tomorrow",
+        )
+
+    def _interval_for(self, pickup: date) -> _Interval:
+        start = dt_util.start_of_local_day(pickup - timedelta(days=1))
+        return start, dt_util.start_of_local_day(pickup)
+
+
+class BinDayReminderBinarySensor(_BinDayBaseBinarySensor):
+    """On from the configured reminder time the day before a pickup until midnight."""
+
+    _attr_icon = "mdi:bell-ring"
+    entity_description = BinarySensorEntityDescription(
+        key="collection_reminder",
+        name="Collection reminder",
+    )
+
+    def __init__(self, coordinator: BinDayCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator, entry, "collection_reminder")
+        value = str(entry.options.get(CONF_REMINDER_TIME, DEFAULT_REMINDER_TIME))
+        self._reminder_time: time = (
+            dt_util.parse_time(value) or dt_util.parse_time(DEFAULT_REMINDER_TIME) or time(18, 0)
+        )
+
+    def _interval_for(self, pickup: date) -> _Interval:
+        day_before = dt_util.start_of_local_day(pickup - timedelta(days=1))
+        start = day_before.replace(
+            hour=self._reminder_time.hour,
+            minute=self._reminder_time.minute,
+            second=self._reminder_time.second,
+        )
+        return start, dt_util.start_of_local_day(pickup)
+
+    @property
+    def extra_state_attributes(self):
+        return {"reminder_time": self._reminder_time.isoformat()}
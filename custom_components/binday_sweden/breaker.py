@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from enum import StrEnum
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CIRCUIT_BREAKERS = f"{DOMAIN}_circuit_breakers"
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RECOVERY_TIMEOUT = 15 * 60.0
+MAX_RECOVERY_TIMEOUT = 6 * 60 * 60.0
+
+
+class BreakerState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Per-provider circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    callers should skip the network entirely. Once ``recovery_timeout`` has
+    elapsed a single trial request is let through (half-open); success closes
+    the breaker, failure re-opens it with a doubled timeout.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+    ) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._base_recovery_timeout = recovery_timeout
+        self._recovery_timeout = recovery_timeout
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_started: float | None = None
+
+    @property
+    def state(self) -> BreakerState:
+        if self._state is BreakerState.OPEN and self._recovery_elapsed():
+            return BreakerState.HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent to the provider now."""
+        if self._state is BreakerState.CLOSED:
+            return True
+        if self._state is BreakerState.OPEN:
+            if not self._recovery_elapsed():
+                return False
+            self._state = BreakerState.HALF_OPEN
+        # Half-open: only one trial request at a time. A trial that never
+        # reported back (e.g. cancelled) is given up after one recovery period.
+        now = time.monotonic()
+        if self._trial_started is not None and now - self._trial_started < self._recovery_timeout:
+            return False
+        self._trial_started = now
+        return True
+
+    def record_success(self) -> None:
+        if self._state is not BreakerState.CLOSED:
+            _LOGGER.info("Provider %s recovered; closing circuit breaker", self.name)
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._recovery_timeout = self._base_recovery_timeout
+        self._trial_started = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state is BreakerState.HALF_OPEN:
+            self._recovery_timeout = min(self._recovery_timeout * 2, MAX_RECOVERY_TIMEOUT)
+            self._open()
+        elif self._state is BreakerState.CLOSED and self._failures >= self._failure_threshold:
+            self._open()
+        self._trial_started = None
+
+    def _open(self) -> None:
+        _LOGGER.warning(
+            "Provider %s failing; opening circuit breaker for %.0f seconds",
+            self.name,
+            self._recovery_timeout,
+        )
+        self._state = BreakerState.OPEN
+        self._opened_at = time.monotonic()
+
+    def _recovery_elapsed(self) -> bool:
+        return time.monotonic() - self._opened_at >= self._recovery_timeout
+
+
+def get_circuit_breaker(hass: HomeAssistant, key: str) -> CircuitBreaker:
+    """Return the circuit breaker shared by all entries using ``key``.
+
+    The key names a provider endpoint, e.g. ``"nsr:https://nsr.se"``.
+    """
+    breakers: dict[str, CircuitBreaker] = hass.data.setdefault(DATA_CIRCUIT_BREAKERS, {})
+    breaker = breakers.get(key)
+    if breaker is None:
+        breaker = breakers[key] = CircuitBreaker(key)
+    return breaker
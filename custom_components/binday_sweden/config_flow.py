@@ -4,6 +4,7 @@ from dataclasses import dataclass
 import json
 import logging
 from pathlib import Path
+from urllib.parse import urlsplit
 
 import voluptuous as vol
 
@@ -18,26 +19,37 @@ from homeassistant.helpers.selector import (
     SelectSelectorMode,
     TextSelector,
     TextSelectorConfig,
+    TimeSelector,
 )
 
 from .const import (
     CONF_ADDRESS_QUERY,
+    CONF_CASSETTE_MODE,
     CONF_CREATE_PER_TYPE_SENSORS,
     CONF_KOMMUN,
     CONF_LAN,
     CONF_MATCH_ID,
     CONF_MATCH_LABEL,
     CONF_PER_TYPE_SENSOR_CAP,
+    CONF_PROVIDER,
+    CONF_PROVIDER_BASE_URL,
+    CONF_REMINDER_TIME,
+    CONF_REPLAY_LATENCY_MS,
     CONF_SCAN_INTERVAL_HOURS,
     CONF_UPCOMING_LIMIT,
     CONF_USE_DEMO_DATA,
+    DEFAULT_CASSETTE_MODE,
     DEFAULT_CREATE_PER_TYPE_SENSORS,
     DEFAULT_PER_TYPE_SENSOR_CAP,
+    DEFAULT_REMINDER_TIME,
+    DEFAULT_REPLAY_LATENCY_MS,
     DEFAULT_SCAN_INTERVAL_HOURS,
     DEFAULT_UPCOMING_LIMIT,
     DOMAIN,
 )
-from .providers import ProviderAddressMatch, get_provider_for_kommun
+from .geo import KommunArea, KommunIndex, load_kommun_index
+from .providers import CassetteMode, ProviderAddressMatch, get_provider_for_kommun
+from .providers.search import async_search_with_variants
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,6 +69,13 @@ async def _async_load_json(hass: HomeAssistant, path: Path):
     return json.loads(text)
 
 
+def _default(value: str | None, allowed: list[str]) -> dict:
+    """Return schema kwargs preselecting ``value`` if it is a valid option."""
+    if value and value in allowed:
+        return {"default": value}
+    return {}
+
+
 class BinDaySwedenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
@@ -66,8 +85,12 @@ class BinDaySwedenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._address_query: str | None = None
         self._scan_interval_hours: float | None = None
         self._matches: list[ProviderAddressMatch] = []
+        self._query_by_id: dict[str, str] = {}
         self._lan_options: list[_KommunOption] | None = None
         self._kommun_by_lan: dict[str, list[dict]] | None = None
+        # Loaded lazily and only held by the flow, so it is freed after onboarding.
+        self._kommun_index: KommunIndex | None = None
+        self._detected: KommunArea | None = None
 
     async def _async_get_lan_options(self) -> list[_KommunOption]:
         if self._lan_options is not None:
@@ -98,9 +121,22 @@ class BinDaySwedenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 options.append(_KommunOption(value=value, label=label))
         return options
 
+    async def _async_detect_kommun(self) -> KommunArea | None:
+        """Guess the kommun from the HA home location using bundled boundaries."""
+        if self._kommun_index is None:
+            try:
+                self._kommun_index = await self.hass.async_add_executor_job(load_kommun_index)
+            except (OSError, ValueError) as err:
+                _LOGGER.debug("Failed to load kommun boundaries: %s", err)
+                self._kommun_index = KommunIndex([])
+        return self._kommun_index.lookup(self.hass.config.latitude, self.hass.config.longitude)
+
     async def async_step_user(self, user_input=None):
         errors: dict[str, str] = {}
 
+        if user_input is None and self._detected is None:
+            self._detected = await self._async_detect_kommun()
+
         try:
             lan_options = await self._async_get_lan_options()
         except Exception as err:  # noqa: BLE001
@@ -119,7 +155,10 @@ class BinDaySwedenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         schema = vol.Schema(
             {
-                vol.Required(CONF_LAN): SelectSelector(
+                vol.Required(
+                    CONF_LAN,
+                    **_default(self._detected.lan if self._detected else None, lan_values),
+                ): SelectSelector(
                     SelectSelectorConfig(
                         options=[{"label": o.label, "value": o.value} for o in lan_options],
                         mode=SelectSelectorMode.DROPDOWN,
@@ -157,7 +196,10 @@ class BinDaySwedenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         schema = vol.Schema(
             {
-                vol.Required(CONF_KOMMUN): SelectSelector(
+                vol.Required(
+                    CONF_KOMMUN,
+                    **_default(self._detected.kommun if self._detected else None, kommun_values),
+                ): SelectSelector(
                     SelectSelectorConfig(
                         options=[{"label": o.label, "value": o.value} for o in kommun_options],
                         mode=SelectSelectorMode.DROPDOWN,
@@ -180,20 +222,21 @@ class BinDaySwedenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_abort(reason="unsupported_municipality")
 
             try:
-                matches = await provider.async_search(address_query)
+                matches, query_by_id = await async_search_with_variants(provider, address_query)
             except Exception as err:  # noqa: BLE001
                 _LOGGER.debug("Provider search failed: %s", err)
                 errors["base"] = "cannot_connect"
             else:
                 if not matches:
                     errors["base"] = "no_matches"
-                elif len(matches) == 1:
-                    self._address_query = address_query
-                    self._scan_interval_hours = scan_interval_hours
-                    return await self._async_create_entry(selected=matches[0])
                 else:
                     self._address_query = address_query
+                    self._query_by_id = query_by_id
                     self._scan_interval_hours = scan_interval_hours
+                    # A single hit is only taken as-is if the query itself found it;
+                    # hits from spelling variants may be a different property.
+                    if len(matches) == 1 and query_by_id.get(matches[0].id) == address_query:
+                        return await self._async_create_entry(selected=matches[0])
                     self._matches = matches
                     return await self.async_step_select()
 
@@ -224,13 +267,34 @@ class BinDaySwedenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     SelectSelectorConfig(
                         options=[{"label": m.label, "value": m.id} for m in self._matches],
                         mode=SelectSelectorMode.DROPDOWN,
-                        sort=True,
+                        # Keep the search ranking (closest to the query first).
+                        sort=False,
                     )
                 )
             }
         )
         return self.async_show_form(step_id="select", data_schema=schema, errors=errors)
 
+    async def async_step_import(self, import_data):
+        """Create an entry for an address resolved by the import_addresses service."""
+        # Imported households are keyed per provider match, so many can coexist.
+        await self.async_set_unique_id(f"{import_data[CONF_PROVIDER]}:{import_data[CONF_MATCH_ID]}")
+        self._abort_if_unique_id_configured()
+
+        return self.async_create_entry(
+            title=import_data[CONF_MATCH_LABEL],
+            data={
+                CONF_LAN: import_data[CONF_LAN],
+                CONF_KOMMUN: import_data[CONF_KOMMUN],
+                CONF_ADDRESS_QUERY: import_data[CONF_ADDRESS_QUERY],
+                CONF_MATCH_ID: import_data[CONF_MATCH_ID],
+                CONF_MATCH_LABEL: import_data[CONF_MATCH_LABEL],
+                CONF_SCAN_INTERVAL_HOURS: import_data.get(
+                    CONF_SCAN_INTERVAL_HOURS, DEFAULT_SCAN_INTERVAL_HOURS
+                ),
+            },
+        )
+
     async def _async_create_entry(self, *, selected: ProviderAddressMatch):
         assert self._lan is not None
         assert self._kommun is not None
@@ -246,7 +310,8 @@ class BinDaySwedenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data={
                 CONF_LAN: self._lan,
                 CONF_KOMMUN: self._kommun,
-                CONF_ADDRESS_QUERY: self._address_query,
+                # The query variant that found this match; fetches search by it again.
+                CONF_ADDRESS_QUERY: self._query_by_id.get(selected.id, self._address_query),
                 CONF_MATCH_ID: selected.id,
                 CONF_MATCH_LABEL: selected.label,
                 CONF_SCAN_INTERVAL_HOURS: self._scan_interval_hours or DEFAULT_SCAN_INTERVAL_HOURS,
@@ -263,8 +328,17 @@ class BinDaySwedenOptionsFlowHandler(config_entries.OptionsFlow):
         self.entry = entry
 
     async def async_step_init(self, user_input=None):
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            base_url = str(user_input.get(CONF_PROVIDER_BASE_URL) or "").strip()
+            if not base_url:
+                user_input.pop(CONF_PROVIDER_BASE_URL, None)
+            elif not _is_http_url(base_url):
+                errors[CONF_PROVIDER_BASE_URL] = "invalid_url"
+            else:
+                user_input[CONF_PROVIDER_BASE_URL] = base_url
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
 
         schema = vol.Schema(
             {
@@ -293,10 +367,44 @@ class BinDaySwedenOptionsFlowHandler(config_entries.OptionsFlow):
                         DEFAULT_PER_TYPE_SENSOR_CAP,
                     ),
                 ): NumberSelector(NumberSelectorConfig(min=1, max=50, step=1, mode=NumberSelectorMode.BOX)),
+                vol.Optional(
+                    CONF_REMINDER_TIME,
+                    default=self.entry.options.get(CONF_REMINDER_TIME, DEFAULT_REMINDER_TIME),
+                ): TimeSelector(),
                 vol.Optional(
                     CONF_USE_DEMO_DATA,
                     default=self.entry.options.get(CONF_USE_DEMO_DATA, False),
                 ): bool,
+                vol.Optional(
+                    CONF_CASSETTE_MODE,
+                    default=self.entry.options.get(CONF_CASSETTE_MODE, DEFAULT_CASSETTE_MODE),
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[m.value for m in CassetteMode],
+                        mode=SelectSelectorMode.DROPDOWN,
+                        translation_key=CONF_CASSETTE_MODE,
+                    )
+                ),
+                vol.Optional(
+                    CONF_REPLAY_LATENCY_MS,
+                    default=self.entry.options.get(CONF_REPLAY_LATENCY_MS, DEFAULT_REPLAY_LATENCY_MS),
+                ): NumberSelector(
+                    NumberSelectorConfig(min=0, max=10000, step=10, mode=NumberSelectorMode.BOX)
+                ),
+                vol.Optional(
+                    CONF_PROVIDER_BASE_URL,
+                    description={"suggested_value": self.entry.options.get(CONF_PROVIDER_BASE_URL)},
+                ): TextSelector(TextSelectorConfig(type="url")),
             }
         )
-        return self.async_show_form(step_id="init", data_schema=schema)
+        if user_input is not None:
+            schema = self.add_suggested_values_to_schema(schema, user_input)
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
+
+
+def _is_http_url(value: str) -> bool:
+    try:
+        parts = urlsplit(value)
+    except ValueError:
+        return False
+    return parts.scheme in ("http", "https") and bool(parts.hostname)
@@ -6,7 +6,7 @@ from homeassistant.const import Platform
 
 DOMAIN = "binday_sweden"
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR]
 
 CONF_KOMMUN = "kommun"
 CONF_LAN = "lan"
@@ -20,6 +20,16 @@ CONF_CREATE_PER_TYPE_SENSORS = "create_per_type_sensors"
 CONF_PER_TYPE_SENSOR_CAP = "per_type_sensor_cap"
 CONF_UPCOMING_LIMIT = "upcoming_limit"
 CONF_USE_DEMO_DATA = "use_demo_data"
+CONF_REMINDER_TIME = "reminder_time"
+CONF_CASSETTE_MODE = "cassette_mode"
+CONF_REPLAY_LATENCY_MS = "replay_latency_ms"
+CONF_PROVIDER_BASE_URL = "provider_base_url"
+
+EVENT_SCHEDULE_CHANGED = f"{DOMAIN}_schedule_changed"
+
+# Dispatcher signals carrying the entry_id of a coordinator that was added/removed.
+SIGNAL_ENTRY_LOADED = f"{DOMAIN}_entry_loaded"
+SIGNAL_ENTRY_UNLOADED = f"{DOMAIN}_entry_unloaded"
 
 DEFAULT_LOOKAHEAD_DAYS = 90
 DEFAULT_SCAN_INTERVAL_HOURS = 12
@@ -27,6 +37,9 @@ DEFAULT_SCAN_INTERVAL_HOURS = 12
 DEFAULT_UPCOMING_LIMIT = 10
 DEFAULT_CREATE_PER_TYPE_SENSORS = False
 DEFAULT_PER_TYPE_SENSOR_CAP = 10
+DEFAULT_REMINDER_TIME = "18:00:00"
+DEFAULT_CASSETTE_MODE = "off"
+DEFAULT_REPLAY_LATENCY_MS = 0
 
 
 @dataclass(frozen=True)
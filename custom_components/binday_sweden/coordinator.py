@@ -1,23 +1,37 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import date, datetime, timedelta
 import logging
 
 from aiohttp import ClientError
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .breaker import BreakerState, CircuitBreaker, get_circuit_breaker
 from .const import (
     CONF_ADDRESS_QUERY,
+    CONF_CASSETTE_MODE,
     CONF_KOMMUN,
     CONF_MATCH_ID,
+    CONF_MATCH_LABEL,
+    CONF_PROVIDER_BASE_URL,
+    CONF_REPLAY_LATENCY_MS,
     CONF_SCAN_INTERVAL_HOURS,
     CONF_USE_DEMO_DATA,
+    DEFAULT_CASSETTE_MODE,
+    DEFAULT_REPLAY_LATENCY_MS,
     DEFAULT_SCAN_INTERVAL_HOURS,
     DOMAIN,
+    EVENT_SCHEDULE_CHANGED,
 )
-from .providers import ProviderData, get_provider_for_kommun
+from .diff import diff_events
+from .history import CollectionHistory
+from .ics import IcsFeed, build_ics_feed
+from .providers import CassetteMode, ProviderData, get_provider_for_kommun
+from .util import slugify
+from .websocket_api import build_schedule_summary, serialize_summary
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,23 +52,168 @@ class BinDayCoordinator(DataUpdateCoordinator[ProviderData]):
                 )
             ),
         )
+        self._breaker: CircuitBreaker | None = None
+        self.last_fetch_time: datetime | None = None
+        self.stale_since: datetime | None = None
+        self.history = CollectionHistory(hass, entry.entry_id, entry.title)
+        self._ics_feed: IcsFeed | None = None
+        self._ics_source: ProviderData | None = None
+        self._summary_cache: dict[int, tuple[ProviderData, date, str]] = {}
+
+    @property
+    def object_id_prefix(self) -> str:
+        """Prefix for default entity object ids.
+
+        The UI-configured household keeps the stable ``binday_sweden_*`` ids;
+        imported households get their address in the id so they stay apart.
+        """
+        if self.entry.source == SOURCE_IMPORT:
+            return f"{DOMAIN}_{slugify(self.entry.title)}"
+        return DOMAIN
+
+    def ics_feed(self) -> IcsFeed | None:
+        """Return the iCalendar feed, rendering it at most once per data change."""
+        data = self.data
+        if data is None:
+            return None
+        if self._ics_source is not data:
+            self._ics_feed = build_ics_feed(data, self._ics_feed)
+            self._ics_source = data
+        return self._ics_feed
+
+    def schedule_summary_json(self, limit: int) -> str | None:
+        """Return the serialized websocket summary, built once per data change/day."""
+        data = self.data
+        if data is None:
+            return None
+        today = dt_util.now().date()
+        cached = self._summary_cache.get(limit)
+        if cached is not None and cached[0] is data and cached[1] == today:
+            return cached[2]
+        payload = serialize_summary(
+            self.entry.entry_id,
+            build_schedule_summary(data, today=today, limit=limit),
+        )
+        self._summary_cache[limit] = (data, today, payload)
+        return payload
 
     async def _async_update_data(self) -> ProviderData:
         kommun = str(self.entry.data[CONF_KOMMUN]).strip()
         address_query = str(self.entry.data[CONF_ADDRESS_QUERY]).strip()
         match_id = str(self.entry.data[CONF_MATCH_ID]).strip()
         use_demo_data = bool(self.entry.options.get(CONF_USE_DEMO_DATA, False))
+        cassette_mode = CassetteMode(self.entry.options.get(CONF_CASSETTE_MODE, DEFAULT_CASSETTE_MODE))
+        replay_latency_ms = self.entry.options.get(CONF_REPLAY_LATENCY_MS, DEFAULT_REPLAY_LATENCY_MS)
+        replay_latency = float(replay_latency_ms) / 1000
 
-        provider = get_provider_for_kommun(self.hass, kommun, use_demo_data=use_demo_data)
+        provider = get_provider_for_kommun(
+            self.hass,
+            kommun,
+            use_demo_data=use_demo_data,
+            cassette_mode=cassette_mode,
+            replay_latency=replay_latency,
+            base_url=self.entry.options.get(CONF_PROVIDER_BASE_URL) or None,
+        )
         if provider is None:
             raise UpdateFailed("Unsupported municipality/provider")
 
+        # Entries behind a caching proxy must not trip the breaker for entries
+        # that talk to the provider directly, and vice versa.
+        breaker_key = f"{provider.provider_id}:{provider.base_url}"
+        if use_demo_data or cassette_mode is CassetteMode.REPLAY:
+            breaker_key = f"{provider.provider_id}:offline"
+        self._breaker = get_circuit_breaker(self.hass, breaker_key)
+        if not self._breaker.allow_request():
+            return self._serve_stale("Provider circuit breaker is open")
+
         try:
-            return await provider.async_fetch(
+            data = await provider.async_fetch(
                 kommun=kommun,
                 address_query=address_query,
                 match_id=match_id,
+                match_label=self.entry.data.get(CONF_MATCH_LABEL),
             )
-        except (ClientError, TimeoutError, RuntimeError, ValueError) as err:
-            raise UpdateFailed(str(err)) from err
+        except ValueError as err:
+            # Address-level problem; the provider itself responded fine.
+            self._breaker.record_success()
+            return self._serve_stale(str(err))
+        except (ClientError, TimeoutError, RuntimeError) as err:
+            self._breaker.record_failure()
+            return self._serve_stale(str(err))
+
+        self._breaker.record_success()
+        if data.match_id != match_id:
+            self._async_persist_rebind(data)
+        self.last_fetch_time = dt_util.utcnow()
+        self.stale_since = None
+        self._async_fire_schedule_changed(self.data, data)
+        await self._async_update_history(data)
+        return data
+
+    async def _async_update_history(self, data: ProviderData) -> None:
+        """Record pickups that have passed; they drop out of provider data afterwards."""
+        await self.history.async_load()
+        if self.history.async_update(data.events, today=dt_util.now().date()):
+            self.history.async_import_statistics()
+
+    def _async_persist_rebind(self, data: ProviderData) -> None:
+        """Store a re-bound match so later refreshes use the new id directly."""
+        unique_id = self.entry.unique_id
+        if self.entry.source == SOURCE_IMPORT:
+            # Imported entries are keyed by provider match (see async_step_import),
+            # so re-importing the address must find this entry under the new id.
+            new_unique_id = f"{data.provider_id}:{data.match_id}"
+            if self.hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, new_unique_id) is None:
+                unique_id = new_unique_id
+        self.hass.config_entries.async_update_entry(
+            self.entry,
+            unique_id=unique_id,
+            data={
+                **self.entry.data,
+                CONF_MATCH_ID: data.match_id,
+                CONF_MATCH_LABEL: data.match_label,
+            },
+        )
+
+    @property
+    def breaker_state(self) -> str:
+        return self._breaker.state.value if self._breaker is not None else BreakerState.CLOSED.value
+
+    def _serve_stale(self, reason: str) -> ProviderData:
+        """Keep serving the last good data while it still covers the next pickup.
+
+        Raises UpdateFailed (making entities unavailable) once there is no good
+        data, or the last known next pickup has already passed.
+        """
+        data = self.data
+        if data is None or self.last_fetch_time is None:
+            raise UpdateFailed(reason)
+
+        fetched_on = dt_util.as_local(self.last_fetch_time).date()
+        next_pickup = next((ev.date for ev in data.events if ev.date >= fetched_on), None)
+        if next_pickup is None or dt_util.now().date() > next_pickup:
+            raise UpdateFailed(f"{reason} (cached schedule is outdated)")
+
+        if self.stale_since is None:
+            self.stale_since = dt_util.utcnow()
+            _LOGGER.warning("Serving cached schedule for %s: %s", self.entry.title, reason)
+        else:
+            _LOGGER.debug("Serving cached schedule for %s: %s", self.entry.title, reason)
+        return data
+
+    def _async_fire_schedule_changed(self, old: ProviderData | None, new: ProviderData) -> None:
+        """Fire a schedule-changed event if pickups were added, removed or moved."""
+        if old is None:
+            return
+        diff = diff_events(old.events, new.events, today=dt_util.now().date())
+        if not diff:
+            return
+        self.hass.bus.async_fire(
+            EVENT_SCHEDULE_CHANGED,
+            {
+                "entry_id": self.entry.entry_id,
+                "match_id": new.match_id,
+                **diff.as_event_data(),
+            },
+        )
 
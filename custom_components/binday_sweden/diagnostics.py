@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_ADDRESS_QUERY, CONF_MATCH_LABEL, DOMAIN
+from .coordinator import BinDayCoordinator
+from .providers.client import async_get_http_metrics
+
+TO_REDACT = {CONF_ADDRESS_QUERY, CONF_MATCH_LABEL}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    coordinator: BinDayCoordinator = hass.data[DOMAIN][entry.entry_id]
+    metrics = async_get_http_metrics(hass)
+    data = coordinator.data
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "provider": data.provider_id if data else None,
+        "event_count": len(data.events) if data else 0,
+        "last_update_success": coordinator.last_update_success,
+        "last_successful_fetch": (
+            coordinator.last_fetch_time.isoformat() if coordinator.last_fetch_time else None
+        ),
+        "stale_since": coordinator.stale_since.isoformat() if coordinator.stale_since else None,
+        "breaker_state": coordinator.breaker_state,
+        "http_latency": metrics.as_dict() if metrics else {},
+    }
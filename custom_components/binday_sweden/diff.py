@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+
+from .const import DEFAULT_LOOKAHEAD_DAYS
+from .providers import ProviderEvent
+
+# Max distance (in days) a removed date may be paired with an added date of the
+# same type and still be reported as a move (e.g. holiday shifts).
+MAX_MOVE_DAYS = 14
+
+_TypeKey = tuple[str, str | None]
+
+
+@dataclass(frozen=True)
+class ScheduleMove:
+    type_raw: str
+    type_formatted: str
+    container_number: str | None
+    from_date: date
+    to_date: date
+
+
+@dataclass(frozen=True)
+class ScheduleDiff:
+    added: list[ProviderEvent] = field(default_factory=list)
+    removed: list[ProviderEvent] = field(default_factory=list)
+    moved: list[ScheduleMove] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.moved)
+
+    def as_event_data(self) -> dict[str, Any]:
+        """Return a compact, JSON-serializable representation."""
+        return {
+            "added": [_event_dict(ev) for ev in self.added],
+            "removed": [_event_dict(ev) for ev in self.removed],
+            "moved": [
+                {
+                    "type_raw": mv.type_raw,
+                    "type_formatted": mv.type_formatted,
+                    "container_number": mv.container_number,
+                    "from": mv.from_date.isoformat(),
+                    "to": mv.to_date.isoformat(),
+                }
+                for mv in self.moved
+            ],
+        }
+
+
+def diff_events(
+    old: list[ProviderEvent],
+    new: list[ProviderEvent],
+    *,
+    today: date,
+    lookahead_days: int = DEFAULT_LOOKAHEAD_DAYS,
+) -> ScheduleDiff:
+    """Compare two event sets per type/container.
+
+    Removals are checked up to the provider lookahead (less MAX_MOVE_DAYS of
+    slack), not up to the last returned event, so a cancelled final pickup is
+    still reported: old 2, 16 and 30 March vs new 2 and 16 March removes
+    30 March. Additions are only reported up to the last old pickup, so the
+    provider extending its lookahead is not a change. If the new set has no
+    upcoming pickups at all (schedule cancelled), every old upcoming pickup
+    is removed.
+    """
+    old = [ev for ev in old if ev.date >= today]
+    new = [ev for ev in new if ev.date >= today]
+    if not old:
+        return ScheduleDiff()
+    if not new:
+        return ScheduleDiff(removed=sorted(old, key=lambda e: e.date))
+
+    horizon = today + timedelta(days=max(lookahead_days - MAX_MOVE_DAYS, 0))
+    added_until = min(horizon, max(ev.date for ev in old))
+    # New dates slightly past the horizon may still be the target of a move.
+    move_horizon = horizon + timedelta(days=MAX_MOVE_DAYS)
+    old_by_key = _index(ev for ev in old if ev.date <= horizon)
+    new_by_key = _index(ev for ev in new if ev.date <= move_horizon)
+
+    added: list[ProviderEvent] = []
+    removed: list[ProviderEvent] = []
+    moved: list[ScheduleMove] = []
+
+    for key in sorted(old_by_key.keys() | new_by_key.keys(), key=lambda k: (k[0], k[1] or "")):
+        old_dates = old_by_key.get(key, {})
+        new_dates = new_by_key.get(key, {})
+        gone = sorted(old_dates.keys() - new_dates.keys())
+        fresh = sorted(new_dates.keys() - old_dates.keys())
+
+        for d in gone:
+            target = _nearest(d, fresh)
+            if target is None:
+                removed.append(old_dates[d])
+                continue
+            fresh.remove(target)
+            ev = new_dates[target]
+            moved.append(
+                ScheduleMove(
+                    type_raw=ev.type_raw,
+                    type_formatted=ev.type_formatted,
+                    container_number=ev.container_number,
+                    from_date=d,
+                    to_date=target,
+                )
+            )
+        added.extend(new_dates[d] for d in fresh if d <= added_until)
+
+    added.sort(key=lambda e: e.date)
+    removed.sort(key=lambda e: e.date)
+    moved.sort(key=lambda m: m.from_date)
+    return ScheduleDiff(added=added, removed=removed, moved=moved)
+
+
+def _index(events) -> dict[_TypeKey, dict[date, ProviderEvent]]:
+    out: dict[_TypeKey, dict[date, ProviderEvent]] = {}
+    for ev in events:
+        out.setdefault((ev.type_raw, ev.container_number), {}).setdefault(ev.date, ev)
+    return out
+
+
+def _nearest(d: date, candidates: list[date]) -> date | None:
+    best: date | None = None
+    for c in candidates:
+        dist = abs((c - d).days)
+        if dist > MAX_MOVE_DAYS:
+            continue
+        if best is None or dist < abs((best - d).days):
+            best = c
+    return best
+
+
+def _event_dict(ev: ProviderEvent) -> dict[str, Any]:
+    return {
+        "date": ev.date.isoformat(),
+        "type_raw": ev.type_raw,
+        "type_formatted": ev.type_formatted,
+        "container_number": ev.container_number,
+    }
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+BOUNDARIES_PATH = Path(__file__).resolve().parent / "data" / "kommun_boundaries.json"
+
+_NODE_SIZE = 8
+
+# The bundled boundaries are generalized, so coastal homes can fall just
+# outside their kommun polygon. Such points snap to the nearest kommun.
+MAX_SNAP_KM = 3.0
+_KM_PER_DEG_LAT = 111.32
+
+# (min_lon, min_lat, max_lon, max_lat)
+_BBox = tuple[float, float, float, float]
+# A polygon is a list of rings; the first ring is the outer boundary, the rest are holes.
+# Each ring is a list of [lon, lat] pairs (GeoJSON order).
+_Polygon = list[list[list[float]]]
+
+
+@dataclass(frozen=True, slots=True)
+class KommunArea:
+    kommun: str
+    lan: str
+    polygons: list[_Polygon]
+    bbox: _BBox
+
+    def distance_km(self, lon: float, lat: float) -> float:
+        """Distance from the point to the nearest outer boundary edge."""
+        kx = _KM_PER_DEG_LAT * math.cos(math.radians(lat))
+        return min(
+            _ring_distance(polygon[0], lon * kx, lat * _KM_PER_DEG_LAT, kx)
+            for polygon in self.polygons
+            if polygon
+        )
+
+    def contains(self, lon: float, lat: float) -> bool:
+        for polygon in self.polygons:
+            if not polygon or not _ring_contains(polygon[0], lon, lat):
+                continue
+            if not any(_ring_contains(hole, lon, lat) for hole in polygon[1:]):
+                return True
+        return False
+
+
+@dataclass(frozen=True, slots=True)
+class _Node:
+    bbox: _BBox
+    children: tuple[_Node, ...] = ()
+    areas: tuple[KommunArea, ...] = ()
+
+
+class KommunIndex:
+    """Bounding-box tree over simplified kommun boundaries.
+
+    The tree is bulk-loaded (sort-tile-recursive) once; a lookup only runs
+    point-in-polygon checks for the few areas whose bbox contains the point.
+    Points outside every polygon snap to the nearest area within MAX_SNAP_KM.
+    """
+
+    def __init__(self, areas: list[KommunArea]) -> None:
+        self._root = _build(areas) if areas else None
+
+    def lookup(self, lat: float, lon: float) -> KommunArea | None:
+        if self._root is None:
+            return None
+        for area in self._candidates(lon, lat, 0.0, 0.0):
+            if area.contains(lon, lat):
+                return area
+
+        margin_lat = MAX_SNAP_KM / _KM_PER_DEG_LAT
+        margin_lon = margin_lat / max(math.cos(math.radians(lat)), 0.01)
+        best: KommunArea | None = None
+        best_km = MAX_SNAP_KM
+        for area in self._candidates(lon, lat, margin_lon, margin_lat):
+            km = area.distance_km(lon, lat)
+            if km <= best_km:
+                best, best_km = area, km
+        return best
+
+    def _candidates(self, lon: float, lat: float, margin_lon: float, margin_lat: float):
+        """Yield areas whose bbox, grown by the margins, contains the point."""
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if not _bbox_contains(node.bbox, lon, lat, margin_lon, margin_lat):
+                continue
+            for area in node.areas:
+                if _bbox_contains(area.bbox, lon, lat, margin_lon, margin_lat):
+                    yield area
+            stack.extend(node.children)
+
+
+def load_kommun_index(path: Path = BOUNDARIES_PATH) -> KommunIndex:
+    """Build the index from the bundled boundary file (blocking)."""
+    if not path.exists():
+        _LOGGER.debug("No kommun boundary data bundled at %s", path)
+        return KommunIndex([])
+    data: dict[str, Any] | list[dict[str, Any]] = json.loads(path.read_text(encoding="utf-8"))
+    if isinstance(data, dict):
+        data = data.get("areas") or []
+    areas: list[KommunArea] = []
+    for item in data:
+        kommun = str(item.get("id", "")).strip()
+        polygons = item.get("polygons") or []
+        if not kommun or not polygons:
+            continue
+        areas.append(
+            KommunArea(
+                kommun=kommun,
+                lan=str(item.get("lan", "")).strip(),
+                polygons=polygons,
+                bbox=_bbox_of(polygons),
+            )
+        )
+    return KommunIndex(areas)
+
+
+def _build(areas: list[KommunArea]) -> _Node:
+    nodes = [
+        _Node(bbox=_union(a.bbox for a in chunk), areas=tuple(chunk))
+        for chunk in _str_chunks(areas, key=lambda a: a.bbox)
+    ]
+    while len(nodes) > 1:
+        nodes = [
+            _Node(bbox=_union(n.bbox for n in chunk), children=tuple(chunk))
+            for chunk in _str_chunks(nodes, key=lambda n: n.bbox)
+        ]
+    return nodes[0]
+
+
+def _str_chunks(items, *, key):
+    """Group items into spatially coherent chunks of at most _NODE_SIZE."""
+    count = len(items)
+    slices = max(1, round((count / _NODE_SIZE) ** 0.5))
+    per_slice = -(-count // slices)
+    by_x = sorted(items, key=lambda i: key(i)[0] + key(i)[2])
+    chunks = []
+    for start in range(0, count, per_slice):
+        column = sorted(by_x[start : start + per_slice], key=lambda i: key(i)[1] + key(i)[3])
+        chunks.extend(column[j : j + _NODE_SIZE] for j in range(0, len(column), _NODE_SIZE))
+    return chunks
+
+
+def _bbox_of(polygons: list[_Polygon]) -> _BBox:
+    lons = [pt[0] for polygon in polygons for pt in polygon[0]]
+    lats = [pt[1] for polygon in polygons for pt in polygon[0]]
+    return min(lons), min(lats), max(lons), max(lats)
+
+
+def _union(boxes) -> _BBox:
+    boxes = list(boxes)
+    return (
+        min(b[0] for b in boxes),
+        min(b[1] for b in boxes),
+        max(b[2] for b in boxes),
+        max(b[3] for b in boxes),
+    )
+
+
+def _bbox_contains(
+    bbox: _BBox,
+    lon: float,
+    lat: float,
+    margin_lon: float = 0.0,
+    margin_lat: float = 0.0,
+) -> bool:
+    return (
+        bbox[0] - margin_lon <= lon <= bbox[2] + margin_lon
+        and bbox[1] - margin_lat <= lat <= bbox[3] + margin_lat
+    )
+
+
+def _ring_contains(ring: list[list[float]], lon: float, lat: float) -> bool:
+    # Even-odd ray casting.
+    inside = False
+    j = len(ring) - 1
+    for i in range(len(ring)):
+        xi, yi = ring[i][0], ring[i][1]
+        xj, yj = ring[j][0], ring[j][1]
+        if (yi > lat) != (yj > lat) and lon < (xj - xi) * (lat - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def _ring_distance(ring: list[list[float]], x: float, y: float, kx: float) -> float:
+    # Point-to-segment distance on a local equirectangular projection (km).
+    best = math.inf
+    for (x1, y1), (x2, y2) in zip(ring, ring[1:]):
+        ax, ay = x1 * kx, y1 * _KM_PER_DEG_LAT
+        bx, by = x2 * kx, y2 * _KM_PER_DEG_LAT
+        dx, dy = bx - ax, by - ay
+        seg = dx * dx + dy * dy
+        t = 0.0 if seg == 0 else max(0.0, min(1.0, ((x - ax) * dx + (y - ay) * dy) / seg))
+        best = min(best, math.hypot(x - ax - t * dx, y - ay - t * dy))
+    return best
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from datetime import date
+import logging
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .providers import ProviderEvent
+from .util import slugify
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+_SAVE_DELAY = 30
+
+
+class CollectionHistory:
+    """Compact per-entry record of past pickups.
+
+    Stored as ``[date ordinal, type index]`` pairs with type names interned
+    in a separate list, deduplicated by (date, type). Upcoming pickups from the
+    latest schedule are persisted as pending and move to the history once their
+    date has passed, so pickups the provider drops afterwards (or that pass
+    while HA is down) are still recorded.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, title: str) -> None:
+        self._hass = hass
+        self._entry_id = entry_id
+        self._title = title
+        self._store: Store[dict] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.history.{entry_id}")
+        self._types: list[str] = []
+        self._type_index: dict[str, int] = {}
+        self._seen: set[tuple[int, int]] = set()
+        self._pending: set[tuple[int, int]] = set()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        if self._loaded:
+            return
+        stored = await self._store.async_load() or {}
+        for name in stored.get("types", []):
+            self._intern(name)
+        self._seen = {(int(o), int(t)) for o, t in stored.get("events", [])}
+        self._pending = {(int(o), int(t)) for o, t in stored.get("pending", [])}
+        self._loaded = True
+
+    def _intern(self, name: str) -> int:
+        idx = self._type_index.get(name)
+        if idx is None:
+            idx = self._type_index[name] = len(self._types)
+            self._types.append(name)
+        return idx
+
+    @callback
+    def async_update(self, events: list[ProviderEvent], *, today: date) -> bool:
+        """Apply a fresh schedule; return True if any pickup was added to the history.
+
+        Pending pickups dated before ``today`` are recorded, as are past events
+        still in the schedule. Upcoming events replace the pending set, since
+        the latest schedule is authoritative for dates that have not passed.
+        """
+        cutoff = today.toordinal()
+        before = len(self._seen)
+        self._seen.update(key for key in self._pending if key[0] < cutoff)
+
+        pending: set[tuple[int, int]] = set()
+        for ev in events:
+            key = (ev.date.toordinal(), self._intern(ev.type_key))
+            if key[0] < cutoff:
+                self._seen.add(key)
+            else:
+                pending.add(key)
+
+        added = len(self._seen) > before
+        if added or pending != self._pending:
+            self._pending = pending
+            self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+        return added
+
+    def _data_to_save(self) -> dict:
+        return {"types": self._types, "events": sorted(self._seen), "pending": sorted(self._pending)}
+
+    @callback
+    def async_import_statistics(self) -> None:
+        """Publish cumulative pickup counts per type as external statistics."""
+        if "recorder" not in self._hass.config.components:
+            return
+
+        by_type: dict[int, list[int]] = {}
+        for ordinal, idx in sorted(self._seen):
+            by_type.setdefault(idx, []).append(ordinal)
+
+        for idx, ordinals in by_type.items():
+            name = self._types[idx]
+            metadata = StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"{self._title} {name} pickups",
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:{slugify(self._entry_id)}_{slugify(name)}_pickups",
+                unit_of_measurement=None,
+            )
+            rows: list[StatisticData] = []
+            for total, ordinal in enumerate(ordinals, start=1):
+                rows.append(
+                    StatisticData(
+                        start=dt_util.start_of_local_day(date.fromordinal(ordinal)),
+                        state=1,
+                        sum=total,
+                    )
+                )
+            async_add_external_statistics(self._hass, metadata, rows)
+
+    async def async_flush(self) -> None:
+        """Write now, cancelling the delayed and final-write saves of this Store.
+
+        Called on unload so no write of this instance can land after the
+        entry is removed and recreate the file.
+        """
+        if self._loaded:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
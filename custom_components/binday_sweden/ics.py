@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from hashlib import sha1
+from http import HTTPStatus
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .providers import ProviderData
+from .util import slugify
+
+ICS_URL = "/api/binday_sweden/{entry_id}/calendar.ics"
+
+_PRODID = "-//tubloo//BinDay Sweden//EN"
+
+
+class IcsFeed:
+    """A rendered iCalendar body plus its ETag."""
+
+    __slots__ = ("body", "etag", "stamp")
+
+    def __init__(self, body: bytes, stamp: datetime) -> None:
+        self.body = body
+        self.stamp = stamp
+        self.etag = f'"{sha1(body).hexdigest()}"'
+
+
+def build_ics_feed(data: ProviderData, previous: IcsFeed | None = None) -> IcsFeed:
+    """Render a feed, reusing ``previous`` if the schedule itself is unchanged.
+
+    DTSTAMP is kept from the previous render when the content matches, so a
+    refresh that returns the same schedule keeps the same ETag.
+    """
+    if previous is not None:
+        body = render_ics(data, stamp=previous.stamp)
+        if body == previous.body:
+            return previous
+    stamp = datetime.now(timezone.utc).replace(microsecond=0)
+    return IcsFeed(render_ics(data, stamp=stamp), stamp)
+
+
+def render_ics(data: ProviderData, *, stamp: datetime) -> bytes:
+    """Render provider events as an all-day iCalendar feed."""
+    dtstamp = stamp.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{_PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(data.match_label)}",
+    ]
+    seen: set[tuple[str, str]] = set()
+    for ev in data.events:
+        day = ev.date.strftime("%Y%m%d")
+        uid_key = slugify(f"{ev.type_raw} {ev.container_number or ''}")
+        if (day, uid_key) in seen:
+            continue
+        seen.add((day, uid_key))
+        summary = ev.type_formatted or ev.type_raw or "Collection"
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{slugify(data.match_id)}-{day}-{uid_key}@{DOMAIN}",
+            f"DTSTAMP:{dtstamp}",
+            f"DTSTART;VALUE=DATE:{day}",
+            f"DTEND;VALUE=DATE:{(ev.date + timedelta(days=1)).strftime('%Y%m%d')}",
+            f"SUMMARY:{_escape(summary)}",
+            f"DESCRIPTION:{_escape(ev.type_raw)}",
+            "TRANSP:TRANSPARENT",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "".join(_fold(line) + "\r\n" for line in lines).encode("utf-8")
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    # RFC 5545: lines longer than 75 octets are folded with CRLF + space.
+    raw = line.encode("utf-8")
+    if len(raw) <= 75:
+        return line
+    parts: list[str] = []
+    current = ""
+    size = 0
+    limit = 75
+    for char in line:
+        width = len(char.encode("utf-8"))
+        if size + width > limit:
+            parts.append(current)
+            current = ""
+            size = 0
+            limit = 74  # continuation lines start with a space
+        current += char
+        size += width
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+class BinDayIcsView(HomeAssistantView):
+    """Serve a config entry's schedule as an .ics feed."""
+
+    url = ICS_URL
+    name = f"api:{DOMAIN}:calendar"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+
+    async def get(self, request: web.Request, entry_id: str) -> web.Response:
+        coordinator = self._hass.data.get(DOMAIN, {}).get(entry_id)
+        if coordinator is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        feed = coordinator.ics_feed()
+        if feed is None:
+            return web.Response(status=HTTPStatus.SERVICE_UNAVAILABLE)
+
+        headers = {"ETag": feed.etag, "Cache-Control": "private, max-age=300"}
+        if_none_match = request.headers.get("If-None-Match", "")
+        if feed.etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match.strip() == "*":
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        return web.Response(
+            body=feed.body,
+            content_type="text/calendar",
+            charset="utf-8",
+            headers=headers,
+        )
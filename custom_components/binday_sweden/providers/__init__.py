@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from .base import Provider, ProviderAddressMatch, ProviderData, ProviderEvent
+from .cassette import CassetteMode
 from .routing import get_provider_for_kommun
 
 __all__ = [
+    "CassetteMode",
     "Provider",
     "ProviderAddressMatch",
     "ProviderData",
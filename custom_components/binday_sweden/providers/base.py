@@ -5,11 +5,12 @@ from datetime import date
 from typing import Protocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProviderAddressMatch:
     id: str
     label: str
-    raw: dict
+    # Full provider item; only populated when a search is made with include_raw=True.
+    raw: dict | None = None
 
 
 @dataclass(frozen=True)
@@ -19,6 +20,11 @@ class ProviderEvent:
     type_formatted: str
     container_number: str | None = None
 
+    @property
+    def type_key(self) -> str:
+        """Key that groups events per collection type (sensors, history, summaries)."""
+        return self.type_formatted or self.type_raw or "Unknown"
+
 
 @dataclass(frozen=True)
 class ProviderData:
@@ -34,9 +40,25 @@ class ProviderData:
 class Provider(Protocol):
     provider_id: str
     provider_name: str
+    # Effective endpoint, e.g. a caching proxy instead of the provider itself.
+    base_url: str
+
+    async def async_search(self, query: str, *, include_raw: bool = False) -> list[ProviderAddressMatch]:
+        """Search for addresses/properties by free text.
+
+        Matches only carry id + label unless include_raw is set.
+        """
 
-    async def async_search(self, query: str) -> list[ProviderAddressMatch]:
-        """Search for addresses/properties by free text."""
+    async def async_fetch(
+        self,
+        *,
+        kommun: str,
+        address_query: str,
+        match_id: str,
+        match_label: str | None = None,
+    ) -> ProviderData:
+        """Fetch and return schedule data for a selected match.
 
-    async def async_fetch(self, *, kommun: str, address_query: str, match_id: str) -> ProviderData:
-        """Fetch and return schedule data for a selected match."""
+        If match_id is gone but match_label uniquely identifies a result, the
+        provider may re-bind; the returned ProviderData carries the new id.
+        """
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+from enum import StrEnum
+import gzip
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CASSETTES = "binday_sweden_cassettes"
+
+CASSETTE_FILENAME = "binday_sweden_cassette.json.gz"
+DEMO_CASSETTE_PATH = Path(__file__).resolve().parent.parent / "fixtures" / "nsr_demo.json"
+
+_WILDCARD = "*"
+_SAVE_DELAY = 5.0
+
+
+class CassetteMode(StrEnum):
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join(query.casefold().split())
+
+
+class Cassette:
+    """Query-indexed store of recorded provider responses.
+
+    Entries are keyed by ``<provider_id>:<normalized query>`` so lookups are a
+    single dict access. Files ending in ``.gz`` are gzip-compressed. A plain
+    provider payload (like the bundled demo fixture) is loaded as a wildcard
+    entry that answers every query.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._unsub_save: Any = None
+        self._unsub_stop: Any = None
+
+    def get(self, provider_id: str, query: str) -> dict[str, Any] | None:
+        return self._entries.get(f"{provider_id}:{_normalize_query(query)}") or self._entries.get(_WILDCARD)
+
+    def record(self, provider_id: str, query: str, payload: dict[str, Any]) -> None:
+        self._entries[f"{provider_id}:{_normalize_query(query)}"] = payload
+
+    def load(self) -> None:
+        """Load entries from disk (blocking)."""
+        if not self.path.exists():
+            return
+        if self.path.suffix == ".gz":
+            with gzip.open(self.path, "rt", encoding="utf-8") as fh:
+                data = json.load(fh)
+        else:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+
+        if isinstance(data, dict) and isinstance(data.get("entries"), dict):
+            self._entries = data["entries"]
+        elif isinstance(data, dict):
+            self._entries = {_WILDCARD: data}
+
+    def save(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Write a snapshot of the entries to disk atomically (blocking)."""
+        text = json.dumps({"version": 1, "entries": entries}, ensure_ascii=False, separators=(",", ":"))
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        if self.path.suffix == ".gz":
+            with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+                fh.write(text)
+        else:
+            tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    @callback
+    def async_schedule_save(self, hass: HomeAssistant) -> None:
+        """Coalesce writes while recording; a pending write is flushed on stop."""
+        if self._unsub_stop is None:
+
+            async def _async_flush(_event: Event) -> None:
+                self._unsub_stop = None
+                if self._unsub_save is None:
+                    return
+                self._unsub_save()
+                self._unsub_save = None
+                await self._async_write(hass)
+
+            self._unsub_stop = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_flush)
+
+        if self._unsub_save is not None:
+            return
+
+        @callback
+        def _async_save(_now) -> None:
+            self._unsub_save = None
+            hass.async_create_task(self._async_write(hass))
+
+        self._unsub_save = async_call_later(hass, _SAVE_DELAY, _async_save)
+
+    async def _async_write(self, hass: HomeAssistant) -> None:
+        # record() keeps mutating the dict on the loop; the executor gets a copy.
+        try:
+            await hass.async_add_executor_job(self.save, dict(self._entries))
+        except OSError as err:
+            _LOGGER.warning("Failed to save cassette %s: %s", self.path, err)
+
+
+async def async_get_cassette(hass: HomeAssistant, path: Path) -> Cassette:
+    """Return the cassette for ``path``, loading the file once per HA run."""
+    loading: dict[Path, asyncio.Task[Cassette]] = hass.data.setdefault(DATA_CASSETTES, {})
+    task = loading.get(path)
+    if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+        task = loading[path] = hass.async_create_task(_async_load_cassette(hass, path))
+    # Shielded so a cancelled caller does not cancel the load for everyone else.
+    return await asyncio.shield(task)
+
+
+async def _async_load_cassette(hass: HomeAssistant, path: Path) -> Cassette:
+    cassette = Cassette(path)
+    try:
+        await hass.async_add_executor_job(cassette.load)
+    except (OSError, ValueError) as err:
+        _LOGGER.warning("Failed to load cassette %s: %s", path, err)
+    return cassette
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, __version__ as HA_VERSION
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.ssl import get_default_context
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HTTP = "binday_sweden_http"
+
+CONNECT_TIMEOUT = 10.0
+READ_TIMEOUT = 20.0
+TOTAL_TIMEOUT = 30.0
+LIMIT_PER_HOST = 4
+KEEPALIVE_TIMEOUT = 60.0
+
+USER_AGENT = f"HomeAssistant/{HA_VERSION} binday_sweden"
+
+
+@dataclass
+class HostLatency:
+    requests: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        done = self.requests - self.errors
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / done, 1) if done else None,
+            "max_ms": round(self.max_ms, 1),
+            "last_ms": round(self.last_ms, 1) if self.last_ms is not None else None,
+        }
+
+
+@dataclass
+class ProviderHttpMetrics:
+    """Per-host request latency, fed by aiohttp trace hooks."""
+
+    hosts: dict[str, HostLatency] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {host: stats.as_dict() for host, stats in self.hosts.items()}
+
+
+def _trace_config(metrics: ProviderHttpMetrics) -> aiohttp.TraceConfig:
+    trace = aiohttp.TraceConfig()
+
+    async def _on_start(_session, ctx: SimpleNamespace, params) -> None:
+        ctx.started = time.monotonic()
+
+    async def _on_end(_session, ctx: SimpleNamespace, params) -> None:
+        elapsed = (time.monotonic() - ctx.started) * 1000
+        stats = metrics.hosts.setdefault(params.url.host or "", HostLatency())
+        stats.requests += 1
+        stats.total_ms += elapsed
+        stats.max_ms = max(stats.max_ms, elapsed)
+        stats.last_ms = elapsed
+        _LOGGER.debug(
+            "%s %s -> %s in %.0f ms", params.method, params.url.host, params.response.status, elapsed
+        )
+
+    async def _on_exception(_session, ctx: SimpleNamespace, params) -> None:
+        stats = metrics.hosts.setdefault(params.url.host or "", HostLatency())
+        stats.requests += 1
+        stats.errors += 1
+        _LOGGER.debug("%s %s failed: %s", params.method, params.url.host, params.exception)
+
+    trace.on_request_start.append(_on_start)
+    trace.on_request_end.append(_on_end)
+    trace.on_request_exception.append(_on_exception)
+    return trace
+
+
+@callback
+def async_get_provider_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the shared provider HTTP session.
+
+    Unlike HA's generic session this one has explicit connect/read/total
+    timeouts, a per-host connection cap, keep-alive reuse across refreshes and
+    config flows, compressed responses and latency tracing.
+    """
+    data = hass.data.get(DATA_HTTP)
+    if data is not None:
+        return data[0]
+
+    metrics = ProviderHttpMetrics()
+    connector = aiohttp.TCPConnector(
+        limit_per_host=LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=300,
+        ssl=get_default_context(),
+    )
+    session = aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=TOTAL_TIMEOUT, connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT),
+        headers={"Accept-Encoding": "gzip, deflate", "User-Agent": USER_AGENT},
+        trace_configs=[_trace_config(metrics)],
+    )
+
+    async def _async_close(_event: Event) -> None:
+        await session.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    hass.data[DATA_HTTP] = (session, metrics)
+    return session
+
+
+@callback
+def async_get_http_metrics(hass: HomeAssistant) -> ProviderHttpMetrics | None:
+    data = hass.data.get(DATA_HTTP)
+    return data[1] if data is not None else None
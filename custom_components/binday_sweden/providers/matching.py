@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+import re
+
+from ..util import normalize_address
+
+_NUMBER_RE = re.compile(r"\d+[a-z]?")
+
+
+def score_address(target: str, candidate: str) -> float:
+    """Return a 0..1 similarity between two normalized address labels.
+
+    Only used to rank candidates for display; it never decides a match.
+    """
+    if target == candidate:
+        return 1.0
+    # Different house numbers are different properties, however similar the street.
+    if _NUMBER_RE.findall(target) != _NUMBER_RE.findall(candidate):
+        return 0.0
+    return SequenceMatcher(None, target, candidate).ratio()
+
+
+def find_rematch(label: str, candidates: list[tuple[str, str]]) -> str | None:
+    """Return the id of the single (id, label) candidate that is the same address.
+
+    Labels must be equal after normalize_address, i.e. they may only differ in
+    case, å/ä/ö, street abbreviations and suffixes. Returns None when no
+    candidate or more than one distinct id matches, so callers never re-bind
+    to a similarly named street or a neighbouring property.
+    """
+    target = normalize_address(label)
+    if not target:
+        return None
+
+    ids = {cand_id for cand_id, cand_label in candidates if normalize_address(cand_label) == target}
+    if len(ids) != 1:
+        return None
+    return ids.pop()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import date
 import json
@@ -11,12 +12,16 @@ from urllib.parse import urlencode
 
 from aiohttp import ClientError
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .base import ProviderAddressMatch, ProviderData, ProviderEvent
+from .cassette import CASSETTE_FILENAME, DEMO_CASSETTE_PATH, CassetteMode, async_get_cassette
+from .client import async_get_provider_session
+from .matching import find_rematch
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_NSR_BASE_URL = "https://nsr.se"
+
 _KARL_RE = re.compile(r"\bKÄRL\s*(\d+)\b", re.IGNORECASE)
 
 
@@ -32,13 +37,28 @@ class NsrProvider:
     provider_id = "nsr"
     provider_name = "NSR AB"
 
-    def __init__(self, hass: HomeAssistant, *, use_demo_data: bool = False) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        *,
+        use_demo_data: bool = False,
+        cassette_mode: CassetteMode = CassetteMode.OFF,
+        replay_latency: float = 0.0,
+        base_url: str | None = None,
+    ) -> None:
         self._hass = hass
-        self._session = async_get_clientsession(hass)
+        # Allows pointing at a caching proxy that speaks the same search API.
+        self._base_url = (base_url or DEFAULT_NSR_BASE_URL).rstrip("/")
+        self._session = async_get_provider_session(hass)
         self._use_demo_data = use_demo_data
-        self._demo_cache: dict[str, Any] | None = None
+        self._cassette_mode = cassette_mode
+        self._replay_latency = replay_latency
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
 
-    async def async_search(self, query: str) -> list[ProviderAddressMatch]:
+    async def async_search(self, query: str, *, include_raw: bool = False) -> list[ProviderAddressMatch]:
         payload = await self._async_request(query=query)
         matches: list[ProviderAddressMatch] = []
         for item in payload.get("fp", []) or []:
@@ -48,10 +68,21 @@ class NsrProvider:
             if not match_id or not address:
                 continue
             label = address if not city else f"{address}, {city}"
-            matches.append(ProviderAddressMatch(id=match_id, label=label, raw=item))
+            # Drop the item (incl. its Exec arrays) unless explicitly requested,
+            # so search results held by config flows stay small.
+            matches.append(
+                ProviderAddressMatch(id=match_id, label=label, raw=item if include_raw else None)
+            )
         return matches
 
-    async def async_fetch(self, *, kommun: str, address_query: str, match_id: str) -> ProviderData:
+    async def async_fetch(
+        self,
+        *,
+        kommun: str,
+        address_query: str,
+        match_id: str,
+        match_label: str | None = None,
+    ) -> ProviderData:
         payload = await self._async_request(query=address_query)
         matches = payload.get("fp", []) or []
         selected: dict[str, Any] | None = None
@@ -60,6 +91,19 @@ class NsrProvider:
                 selected = item
                 break
 
+        if selected is None and match_label:
+            # NSR occasionally reissues ids; re-bind locally by address label.
+            new_id = find_rematch(
+                match_label,
+                [(str(item.get("id", "")).strip(), _format_label(item)) for item in matches],
+            )
+            if new_id:
+                selected = next(item for item in matches if str(item.get("id", "")).strip() == new_id)
+                _LOGGER.info(
+                    "Match id %s no longer found; re-bound to %s (%s)", match_id, new_id, match_label
+                )
+                match_id = new_id
+
         if selected is None:
             raise ValueError("Selected address/property no longer found in provider results")
 
@@ -82,11 +126,22 @@ class NsrProvider:
             return {"fp": [], "q": query}
 
         # NOTE: NSR endpoint appears undocumented; be polite with update intervals + caching.
-        url = "https://nsr.se/api/wastecalendar/search?" + urlencode({"query": query})
+        url = f"{self._base_url}/api/wastecalendar/search?" + urlencode({"query": query})
 
         # Developer ergonomics: allow demo fixture without hitting endpoint.
         if self._use_demo_data:
-            return await self._async_load_demo_fixture()
+            cassette = await async_get_cassette(self._hass, DEMO_CASSETTE_PATH)
+            return cassette.get(self.provider_id, query) or {"fp": [], "q": query}
+
+        if self._cassette_mode is CassetteMode.REPLAY:
+            cassette = await async_get_cassette(self._hass, Path(self._hass.config.path(CASSETTE_FILENAME)))
+            if self._replay_latency > 0:
+                await asyncio.sleep(self._replay_latency)
+            payload = cassette.get(self.provider_id, query)
+            if payload is None:
+                _LOGGER.debug("No recorded response for query: %s", query)
+                return {"fp": [], "q": query}
+            return payload
 
         try:
             async with self._session.get(url, raise_for_status=False) as resp:
@@ -95,24 +150,15 @@ class NsrProvider:
                 if resp.status >= 400:
                     text = await resp.text()
                     raise RuntimeError(f"Provider error (HTTP {resp.status}): {text[:200]}")
-                return await resp.json(content_type=None)
+                payload = await resp.json(content_type=None)
         except (ClientError, TimeoutError, json.JSONDecodeError) as err:
             raise RuntimeError(f"Failed to fetch NSR data: {err}") from err
 
-    async def _async_load_demo_fixture(self) -> dict[str, Any]:
-        if self._demo_cache is None:
-            self._demo_cache = await _async_load_fixture(self._hass)
-        return self._demo_cache
-
-
-def _read_fixture_text() -> str:
-    path = Path(__file__).resolve().parent.parent / "fixtures" / "nsr_demo.json"
-    return path.read_text(encoding="utf-8")
-
-
-async def _async_load_fixture(hass: HomeAssistant) -> dict[str, Any]:
-    text = await hass.async_add_executor_job(_read_fixture_text)
-    return json.loads(text)
+        if self._cassette_mode is CassetteMode.RECORD:
+            cassette = await async_get_cassette(self._hass, Path(self._hass.config.path(CASSETTE_FILENAME)))
+            cassette.record(self.provider_id, query, payload)
+            cassette.async_schedule_save(self._hass)
+        return payload
 
 
 def _format_label(item: dict[str, Any]) -> str:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from homeassistant.core import HomeAssistant
 
+from .cassette import CassetteMode
 from .nsr import NsrProvider
 
 
@@ -34,8 +35,17 @@ def get_provider_for_kommun(
     kommun: str,
     *,
     use_demo_data: bool = False,
+    cassette_mode: CassetteMode = CassetteMode.OFF,
+    replay_latency: float = 0.0,
+    base_url: str | None = None,
 ):
     """Return a Provider instance for a kommun, or None if unsupported."""
     if _kommun_variants(kommun) & _NSR_KOMMUNER:
-        return NsrProvider(hass, use_demo_data=use_demo_data)
+        return NsrProvider(
+            hass,
+            use_demo_data=use_demo_data,
+            cassette_mode=cassette_mode,
+            replay_latency=replay_latency,
+            base_url=base_url,
+        )
     return None
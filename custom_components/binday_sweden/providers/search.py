@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import re
+
+from ..util import normalize_address
+from .base import Provider, ProviderAddressMatch
+from .matching import score_address
+
+DEFAULT_VARIANT_CONCURRENCY = 3
+MAX_VARIANTS = 6
+
+_HOUSE_LETTER_RE = re.compile(r"\b(\d+)\s*[A-Za-zÅÄÖåäö]\b")
+_GATAN_RE = re.compile(r"(?<=\w)gatan\b", re.IGNORECASE)
+_G_ABBREV_RE = re.compile(r"(?<=\w)g\.", re.IGNORECASE)
+_VAGEN_RE = re.compile(r"(?<=\w)vägen\b", re.IGNORECASE)
+_V_ABBREV_RE = re.compile(r"(?<=\w)v\.", re.IGNORECASE)
+_FOLD = str.maketrans({"å": "a", "ä": "a", "ö": "o", "Å": "A", "Ä": "A", "Ö": "O"})
+
+
+def query_variants(query: str) -> list[str]:
+    """Return alternative spellings of an address query, most likely first."""
+    query = " ".join(query.split())
+    street = query.split(",", 1)[0].strip()
+    bases = [query, street] if street != query else [query]
+
+    candidates: list[str] = []
+    for base in bases:
+        candidates.append(base)
+        candidates.append(_HOUSE_LETTER_RE.sub(r"\1", base))
+        candidates.append(_G_ABBREV_RE.sub("gatan", base))
+        candidates.append(_GATAN_RE.sub("g.", base))
+        candidates.append(_V_ABBREV_RE.sub("vägen", base))
+        candidates.append(_VAGEN_RE.sub("v.", base))
+        candidates.append(base.translate(_FOLD))
+
+    seen = {query.casefold()}
+    out: list[str] = []
+    for candidate in candidates:
+        candidate = " ".join(candidate.split())
+        if not candidate or candidate.casefold() in seen:
+            continue
+        seen.add(candidate.casefold())
+        out.append(candidate)
+    return out[:MAX_VARIANTS]
+
+
+async def async_search_with_variants(
+    provider: Provider,
+    query: str,
+    *,
+    concurrency: int = DEFAULT_VARIANT_CONCURRENCY,
+) -> tuple[list[ProviderAddressMatch], dict[str, str]]:
+    """Search ``query``; if nothing matches, try spelling variants concurrently.
+
+    Variant results are merged, deduplicated by id and ranked by similarity to
+    the original query. Errors are only raised if every variant failed.
+
+    Returns the matches plus the query that found each match id; that query
+    is what must be stored, since later fetches search by it again.
+    """
+    matches = await provider.async_search(query)
+    variants = query_variants(query)
+    if matches or not variants:
+        return matches, {m.id: query for m in matches}
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _search(variant: str) -> list[ProviderAddressMatch]:
+        async with semaphore:
+            return await provider.async_search(variant)
+
+    results = await asyncio.gather(*(_search(v) for v in variants), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if len(errors) == len(results):
+        raise errors[0]
+
+    by_id: dict[str, ProviderAddressMatch] = {}
+    query_by_id: dict[str, str] = {}
+    for variant, result in zip(variants, results):
+        if isinstance(result, BaseException):
+            continue
+        for match in result:
+            if match.id not in by_id:
+                by_id[match.id] = match
+                query_by_id[match.id] = variant
+
+    target = normalize_address(query)
+    ranked = sorted(
+        by_id.values(),
+        key=lambda m: (-score_address(target, normalize_address(m.label)), m.label),
+    )
+    return ranked, query_by_id
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -57,6 +57,10 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
 def _today_local() -> date:
     return dt_util.now().date()
 
@@ -94,7 +98,7 @@ def _next_dates_by_type(events: list[ProviderEvent]) -> dict[str, date]:
     for ev in events:
         if ev.date < today:
             continue
-        key = ev.type_formatted or ev.type_raw or "Unknown"
+        key = ev.type_key
         if key not in out or ev.date < out[key]:
             out[key] = ev.date
     return dict(sorted(out.items(), key=lambda kv: (kv[1], kv[0].lower())))
@@ -171,6 +175,8 @@ class _BinDayBaseSensor(CoordinatorEntity[BinDayCoordinator], SensorEntity):
                 for ev in next_day_events
             ],
             "upcoming": upcoming,
+            "stale": self.coordinator.stale_since is not None,
+            "stale_since": _iso(self.coordinator.stale_since),
         }
 
 
@@ -184,7 +190,7 @@ class BinDayNextCollectionDateSensor(_BinDayBaseSensor):
     def __init__(self, coordinator: BinDayCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_next_collection_date"
-        self._attr_suggested_object_id = "binday_sweden_next_collection_date"
+        self._attr_suggested_object_id = f"{coordinator.object_id_prefix}_next_collection_date"
 
     @property
     def native_value(self) -> date | None:
@@ -204,7 +210,7 @@ class BinDayNextCollectionTypeSensor(_BinDayBaseSensor):
     def __init__(self, coordinator: BinDayCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_next_collection_type"
-        self._attr_suggested_object_id = "binday_sweden_next_collection_type"
+        self._attr_suggested_object_id = f"{coordinator.object_id_prefix}_next_collection_type"
 
     @property
     def native_value(self) -> str | None:
@@ -245,7 +251,7 @@ class BinDayDaysUntilNextCollectionSensor(_BinDayBaseSensor):
     def __init__(self, coordinator: BinDayCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_days_until_next_collection"
-        self._attr_suggested_object_id = "binday_sweden_days_until_next_collection"
+        self._attr_suggested_object_id = f"{coordinator.object_id_prefix}_days_until_next_collection"
 
     @property
     def native_value(self) -> int | None:
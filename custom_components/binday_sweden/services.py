@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import persistent_notification
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.util.yaml import load_yaml
+
+from .const import (
+    CONF_ADDRESS_QUERY,
+    CONF_KOMMUN,
+    CONF_LAN,
+    CONF_MATCH_ID,
+    CONF_MATCH_LABEL,
+    CONF_PROVIDER,
+    CONF_SCAN_INTERVAL_HOURS,
+    DEFAULT_SCAN_INTERVAL_HOURS,
+    DOMAIN,
+)
+from .providers import Provider, ProviderAddressMatch, get_provider_for_kommun
+from .providers.search import async_search_with_variants
+from .util import normalize_address
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_IMPORT_ADDRESSES = "import_addresses"
+
+ATTR_ADDRESSES = "addresses"
+ATTR_ADDRESS = "address"
+ATTR_FILE = "file"
+
+IMPORT_CONCURRENCY = 5
+
+# Relative import files are read from here, never from the config directory
+# itself (secrets.yaml, .storage/...).
+IMPORT_DIR = DOMAIN
+_IMPORT_SUFFIXES = {".csv", ".yaml", ".yml"}
+
+_ROW_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_KOMMUN): cv.string,
+        vol.Required(ATTR_ADDRESS): cv.string,
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+IMPORT_ADDRESSES_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_ADDRESSES): vol.All(cv.ensure_list, [_ROW_SCHEMA]),
+            vol.Optional(ATTR_FILE): cv.string,
+            vol.Optional(CONF_SCAN_INTERVAL_HOURS, default=DEFAULT_SCAN_INTERVAL_HOURS): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=168)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_ADDRESSES, ATTR_FILE),
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    async def _async_import(call: ServiceCall) -> None:
+        rows: list[dict[str, Any]] = list(call.data.get(ATTR_ADDRESSES, []))
+        if ATTR_FILE in call.data:
+            rows += await _async_read_rows(hass, call.data[ATTR_FILE])
+        report = await async_import_addresses(
+            hass, rows, scan_interval_hours=call.data[CONF_SCAN_INTERVAL_HOURS]
+        )
+        persistent_notification.async_create(
+            hass,
+            _format_report(report),
+            title="BinDay Sweden address import",
+            notification_id=f"{DOMAIN}_{SERVICE_IMPORT_ADDRESSES}",
+        )
+
+    # Creates config entries, so admins only. The admin helper does not pass
+    # service responses through; the report is posted as a notification.
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_IMPORT_ADDRESSES,
+        _async_import,
+        schema=IMPORT_ADDRESSES_SCHEMA,
+    )
+
+
+def _format_report(report: dict[str, list[dict[str, Any]]]) -> str:
+    lines = [", ".join(f"{len(items)} {name}" for name, items in report.items())]
+    for name, items in report.items():
+        if name == "created" or not items:
+            continue
+        lines.append(f"\n**{name}**")
+        for item in items:
+            detail = item.get("error") or "; ".join(item.get("candidates", []))
+            line = f"- {item[CONF_KOMMUN]}: {item[ATTR_ADDRESS]}"
+            lines.append(f"{line} ({detail})" if detail else line)
+    return "\n".join(lines)
+
+
+async def _async_read_rows(hass: HomeAssistant, file: str) -> list[dict[str, Any]]:
+    import_dir = Path(hass.config.path(IMPORT_DIR))
+
+    def _resolve() -> Path | None:
+        resolved = (import_dir / file).resolve()
+        if resolved.is_relative_to(import_dir.resolve()):
+            return resolved
+        # An allowlisted config directory must not expose secrets.yaml etc.
+        if resolved.is_relative_to(Path(hass.config.config_dir).resolve()):
+            return None
+        return resolved if hass.config.is_allowed_path(str(resolved)) else None
+
+    # Relative names live in <config>/binday_sweden/; anything else must be in
+    # allowlist_external_dirs (outside the config directory).
+    path = await hass.async_add_executor_job(_resolve)
+    if path is None:
+        raise HomeAssistantError(
+            f"Import file must be in {import_dir} or in allowlist_external_dirs: {file}"
+        )
+    if path.suffix.lower() not in _IMPORT_SUFFIXES:
+        raise HomeAssistantError(f"Import file must be .csv, .yaml or .yml: {file}")
+
+    def _read() -> list[dict[str, Any]]:
+        if path.suffix.lower() == ".csv":
+            text = path.read_text(encoding="utf-8-sig")
+            return [dict(row) for row in csv.DictReader(io.StringIO(text))]
+        data = load_yaml(str(path))
+        return data if isinstance(data, list) else (data or {}).get(ATTR_ADDRESSES, [])
+
+    try:
+        raw_rows = await hass.async_add_executor_job(_read)
+    except (OSError, ValueError, HomeAssistantError) as err:
+        raise HomeAssistantError(f"Failed to read import file {file}: {err}") from err
+
+    try:
+        return [_ROW_SCHEMA(row) for row in raw_rows]
+    except vol.Invalid as err:
+        raise HomeAssistantError(f"Invalid row in import file {file}: {err}") from err
+
+
+def _read_kommun_data() -> tuple[dict[str, str], dict[str, list[str]]]:
+    data_dir = Path(__file__).resolve().parent / "data"
+    kommun_to_lan = json.loads((data_dir / "kommun_to_lan.json").read_text(encoding="utf-8"))
+    kommun_towns = json.loads((data_dir / "kommun_towns.json").read_text(encoding="utf-8"))
+    return kommun_to_lan, kommun_towns
+
+
+def _canonical_kommun(kommun: str, kommun_to_lan: dict[str, str]) -> tuple[str, str | None]:
+    """Map a free-form kommun name (e.g. "Helsingborg") to its id and län."""
+    kommun = kommun.strip()
+    for candidate in (kommun, f"{kommun}s"):
+        if candidate in kommun_to_lan:
+            return candidate, kommun_to_lan[candidate]
+    folded = kommun.casefold().removesuffix(" kommun")
+    for known, lan in kommun_to_lan.items():
+        if known.casefold() in (folded, f"{folded}s"):
+            return known, lan
+    return kommun, None
+
+
+async def async_import_addresses(
+    hass: HomeAssistant,
+    rows: list[dict[str, Any]],
+    *,
+    scan_interval_hours: float = DEFAULT_SCAN_INTERVAL_HOURS,
+) -> dict[str, list[dict[str, Any]]]:
+    """Resolve kommun + address rows concurrently and create entries for unique matches."""
+    kommun_to_lan, kommun_towns = await hass.async_add_executor_job(_read_kommun_data)
+    report: dict[str, list[dict[str, Any]]] = {
+        "created": [],
+        "already_configured": [],
+        "ambiguous": [],
+        "unmatched": [],
+        "unsupported": [],
+        "failed": [],
+    }
+
+    providers: dict[str, Provider] = {}
+    # Identical (provider, query) searches across rows share one request.
+    searches: dict[tuple[str, str], asyncio.Task] = {}
+    # Bounds searches and entry creation alike: each created entry is set up
+    # and refreshed (another provider request) before its flow returns.
+    semaphore = asyncio.Semaphore(IMPORT_CONCURRENCY)
+
+    async def _async_search(provider: Provider, query: str):
+        async with semaphore:
+            return await async_search_with_variants(provider, query)
+
+    async def _async_resolve(row: dict[str, Any]) -> None:
+        kommun, lan = _canonical_kommun(row[CONF_KOMMUN], kommun_to_lan)
+        address = row[ATTR_ADDRESS].strip()
+        item = {CONF_KOMMUN: kommun, ATTR_ADDRESS: address}
+
+        provider = get_provider_for_kommun(hass, kommun)
+        if provider is None or lan is None:
+            report["unsupported"].append(item)
+            return
+        provider = providers.setdefault(provider.provider_id, provider)
+
+        key = (provider.provider_id, normalize_address(address))
+        if key not in searches:
+            searches[key] = hass.async_create_task(_async_search(provider, address))
+        try:
+            matches, query_by_id = await searches[key]
+        except Exception as err:  # noqa: BLE001
+            report["failed"].append({**item, "error": str(err)})
+            return
+
+        selected = _pick_match(address, matches, kommun_towns.get(kommun, []))
+        if selected is None:
+            if matches:
+                report["ambiguous"].append({**item, "candidates": [m.label for m in matches[:10]]})
+            else:
+                report["unmatched"].append(item)
+            return
+
+        item[CONF_MATCH_LABEL] = selected.label
+        try:
+            async with semaphore:
+                result = await hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": SOURCE_IMPORT},
+                    data={
+                        CONF_PROVIDER: provider.provider_id,
+                        CONF_LAN: lan,
+                        CONF_KOMMUN: kommun,
+                        CONF_ADDRESS_QUERY: query_by_id.get(selected.id, address),
+                        CONF_MATCH_ID: selected.id,
+                        CONF_MATCH_LABEL: selected.label,
+                        CONF_SCAN_INTERVAL_HOURS: scan_interval_hours,
+                    },
+                )
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Address import failed for %s, %s: %s", address, kommun, err)
+            report["failed"].append({**item, "error": str(err)})
+            return
+        if result.get("type") == "create_entry":
+            report["created"].append(item)
+        else:
+            report["already_configured"].append(item)
+
+    await asyncio.gather(*(_async_resolve(row) for row in rows))
+    _LOGGER.info(
+        "Address import: %s",
+        ", ".join(f"{len(items)} {name}" for name, items in report.items()),
+    )
+    return report
+
+
+def _split_label(label: str) -> tuple[str, str]:
+    street, _, city = label.partition(",")
+    return normalize_address(street), normalize_address(city)
+
+
+def _pick_match(
+    address: str,
+    matches: list[ProviderAddressMatch],
+    towns: list[str],
+) -> ProviderAddressMatch | None:
+    """Return the match to import for ``address``, or None if it is not certain.
+
+    The street must be the same address once normalized, and the match's city
+    must be one of the row's kommun's towns (and the row's own city, if it has
+    one). NSR searches span several kommuner, so a same-named street in a
+    neighbouring kommun is left ambiguous rather than imported.
+    """
+    street, city = _split_label(address)
+    allowed = {normalize_address(town) for town in towns}
+    if city:
+        allowed &= {city}
+    if not street or not allowed:
+        return None
+
+    selected: dict[str, ProviderAddressMatch] = {}
+    for match in matches:
+        match_street, match_city = _split_label(match.label)
+        if match_street == street and match_city in allowed:
+            selected[match.id] = match
+    if len(selected) != 1:
+        return None
+    return next(iter(selected.values()))
@@ -4,12 +4,36 @@ import re
 
 
 _NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_STREET_ABBREV_RES = (
+    (re.compile(r"(?<=[a-z])g\.(?=\s|\d|,|$)"), "gatan"),
+    (re.compile(r"(?<=[a-z])v\.(?=\s|\d|,|$)"), "vagen"),
+)
+_STREET_SUFFIX_RE = re.compile(r"(?<=[a-z])(gata|gatan|vag|vagen)\b")
+_HOUSE_LETTER_RE = re.compile(r"\b(\d+)\s+([a-z])\b")
+
+
+def _fold(value: str) -> str:
+    value = value.strip().lower()
+    return value.replace("å", "a").replace("ä", "a").replace("ö", "o")
 
 
 def slugify(value: str) -> str:
     """Return a stable, HA-entity-safe slug."""
-    value = value.strip().lower()
-    value = value.replace("å", "a").replace("ä", "a").replace("ö", "o")
+    value = _fold(value)
     value = _NON_ALNUM_RE.sub("_", value).strip("_")
     return value or "unknown"
 
+
+def normalize_address(value: str) -> str:
+    """Return a comparable form of an address label.
+
+    Folds case and å/ä/ö, expands "g."/"v." abbreviations, unifies
+    "gata/gatan" and "väg/vägen", and joins house-number letters ("12 A" -> "12a").
+    """
+    value = _fold(value)
+    for pattern, repl in _STREET_ABBREV_RES:
+        value = pattern.sub(repl, value)
+    value = _NON_ALNUM_RE.sub(" ", value)
+    value = _STREET_SUFFIX_RE.sub(lambda m: "gatan" if m.group(1).startswith("gat") else "vagen", value)
+    value = _HOUSE_LETTER_RE.sub(r"\1\2", value)
+    return " ".join(value.split())
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import date
+import json
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_track_time_change
+
+from .const import DOMAIN, SIGNAL_ENTRY_LOADED, SIGNAL_ENTRY_UNLOADED
+from .providers import ProviderData
+
+WS_SUBSCRIBE_SCHEDULE = f"{DOMAIN}/subscribe_schedule"
+
+DEFAULT_SUMMARY_EVENTS = 10
+MAX_SUMMARY_EVENTS = 50
+
+
+def build_schedule_summary(data: ProviderData, *, today: date, limit: int) -> dict[str, Any]:
+    """Return the compact per-entry summary pushed to dashboards."""
+    next_dates: dict[str, str] = {}
+    upcoming: list[list[Any]] = []
+    for ev in data.events:
+        if ev.date < today:
+            continue
+        key = ev.type_key
+        next_dates.setdefault(key, ev.date.isoformat())
+        if len(upcoming) < limit:
+            upcoming.append([ev.date.isoformat(), ev.type_formatted, ev.type_raw, ev.container_number])
+    return {
+        "match_label": data.match_label,
+        "next_dates": next_dates,
+        # [date, type_formatted, type_raw, container_number]
+        "events": upcoming,
+    }
+
+
+def serialize_summary(entry_id: str, summary: dict[str, Any]) -> str:
+    return json.dumps({"entry_id": entry_id, **summary}, ensure_ascii=False, separators=(",", ":"))
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    websocket_api.async_register_command(hass, ws_subscribe_schedule)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_SUBSCRIBE_SCHEDULE,
+        vol.Optional("entry_id"): str,
+        vol.Optional("limit", default=DEFAULT_SUMMARY_EVENTS): vol.All(
+            int, vol.Range(min=1, max=MAX_SUMMARY_EVENTS)
+        ),
+    }
+)
+@callback
+def ws_subscribe_schedule(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Push a summary per entry now, and again only when it changes.
+
+    Entries are tracked through the load/unload signals rather than the
+    coordinators present at subscribe time, so reloaded and newly added
+    entries are pushed and unloaded coordinators are released.
+    """
+    msg_id: int = msg["id"]
+    limit: int = msg["limit"]
+    only_entry_id: str | None = msg.get("entry_id")
+    if only_entry_id is not None and only_entry_id not in hass.data.get(DOMAIN, {}):
+        connection.send_error(msg_id, websocket_api.ERR_NOT_FOUND, "Entry not found")
+        return
+
+    last_sent: dict[str, str] = {}
+    listeners: dict[str, Callable[[], None]] = {}
+
+    @callback
+    def _async_push(entry_id: str) -> None:
+        coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+        if coordinator is None:
+            return
+        payload = coordinator.schedule_summary_json(limit)
+        if payload is None or last_sent.get(entry_id) == payload:
+            return
+        last_sent[entry_id] = payload
+        # The summary is already serialized (and shared between subscribers);
+        # only the message envelope is built per connection.
+        connection.send_message(f'{{"id":{msg_id},"type":"event","event":{payload}}}')
+
+    @callback
+    def _async_push_all(*_: Any) -> None:
+        for entry_id in listeners:
+            _async_push(entry_id)
+
+    @callback
+    def _async_entry_unloaded(entry_id: str) -> None:
+        unsub = listeners.pop(entry_id, None)
+        if unsub is not None:
+            unsub()
+        last_sent.pop(entry_id, None)
+
+    @callback
+    def _async_entry_loaded(entry_id: str) -> None:
+        if only_entry_id is not None and entry_id != only_entry_id:
+            return
+        coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+        if coordinator is None:
+            return
+        _async_entry_unloaded(entry_id)
+        listeners[entry_id] = coordinator.async_add_listener(lambda: _async_push(entry_id))
+        _async_push(entry_id)
+
+    unsubs: list[Callable[[], None]] = [
+        async_dispatcher_connect(hass, SIGNAL_ENTRY_LOADED, _async_entry_loaded),
+        async_dispatcher_connect(hass, SIGNAL_ENTRY_UNLOADED, _async_entry_unloaded),
+        # "Next" dates shift at midnight even when the data does not.
+        async_track_time_change(hass, _async_push_all, hour=0, minute=0, second=1),
+    ]
+
+    @callback
+    def _async_unsub() -> None:
+        for unsub in unsubs:
+            unsub()
+        for entry_id in list(listeners):
+            _async_entry_unloaded(entry_id)
+
+    connection.subscriptions[msg_id] = _async_unsub
+    connection.send_result(msg_id)
+    for entry_id in list(hass.data.get(DOMAIN, {})):
+        _async_entry_loaded(entry_id)
@@ -0,0 +1,87 @@
+"""Regenerate custom_components/binday_sweden/data/kommun_boundaries.json.
+
+Source: the municipality map of the ``swemaps`` package (MIT), which repackages
+the digital kommun boundaries published by Statistics Sweden (SCB) in WGS 84.
+Those geometries are already generalized; coordinates are rounded to 4 decimals
+(about 10 m) and tiny rings are dropped to keep the bundled file small.
+
+Usage (from a venv with swemaps, pyarrow and shapely installed):
+
+    python scripts/build_kommun_boundaries.py
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pyarrow.parquet as pq
+import shapely
+import swemaps
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = REPO_ROOT / "custom_components" / "binday_sweden" / "data"
+
+ATTRIBUTION = "Kommun boundaries: Statistics Sweden (SCB), via the swemaps package; simplified."
+
+_PRECISION = 4
+# Rings smaller than this (in square degrees) are dropped: islets and slivers.
+_MIN_RING_AREA = 1e-6
+
+# SCB kommun names that do not map to an id by adding a genitive "s".
+_NAME_TO_ID = {
+    "Falun": "Falu",
+    "Gotland": "Region Gotland",
+}
+
+
+def _kommun_id(name: str, kommun_to_lan: dict[str, str]) -> str:
+    for candidate in (_NAME_TO_ID.get(name), name, f"{name}s"):
+        if candidate in kommun_to_lan:
+            return candidate
+    raise KeyError(f"No kommun id for SCB name {name!r}")
+
+
+def _ring(coords) -> list[list[float]]:
+    return [[round(x, _PRECISION), round(y, _PRECISION)] for x, y in coords]
+
+
+def _polygons(geometry) -> list[list[list[list[float]]]]:
+    out = []
+    for polygon in getattr(geometry, "geoms", [geometry]):
+        if polygon.area < _MIN_RING_AREA:
+            continue
+        rings = [_ring(polygon.exterior.coords)]
+        rings += [
+            _ring(hole.coords)
+            for hole in polygon.interiors
+            if shapely.Polygon(hole).area >= _MIN_RING_AREA
+        ]
+        out.append(rings)
+    return out
+
+
+def main() -> None:
+    kommun_to_lan = json.loads((DATA_DIR / "kommun_to_lan.json").read_text(encoding="utf-8"))
+    table = pq.read_table(swemaps.get_path("kommun"))
+    names = table.column("kommun").to_pylist()
+    geometries = shapely.from_wkb(table.column("geometry").to_pylist())
+
+    areas = []
+    for name, geometry in sorted(zip(names, geometries), key=lambda item: item[0]):
+        kommun = _kommun_id(name, kommun_to_lan)
+        areas.append({"id": kommun, "lan": kommun_to_lan[kommun], "polygons": _polygons(geometry)})
+
+    # One area per line keeps diffs between regenerations readable.
+    lines = [json.dumps(area, ensure_ascii=False, separators=(",", ":")) for area in areas]
+    text = (
+        "{\n"
+        f'"attribution":{json.dumps(ATTRIBUTION, ensure_ascii=False)},\n'
+        '"areas":[\n' + ",\n".join(lines) + "\n]\n}\n"
+    )
+    (DATA_DIR / "kommun_boundaries.json").write_text(text, encoding="utf-8")
+    print(f"Wrote {len(areas)} areas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Caching proxy for the NSR waste calendar search API.
+
+Run one of these next to a fleet of Home Assistant instances and point each
+BinDay Sweden entry's "Provider base URL" option at it. Upstream traffic then
+scales with the number of distinct addresses, not with the number of instances.
+
+- Identical in-flight queries are coalesced into one upstream request.
+- Successful responses are cached for ``--ttl`` seconds (LRU-bounded).
+- If upstream fails (error, timeout, 429/5xx), a cached response up to
+  ``--max-stale`` seconds old is served instead.
+
+Usage (only needs aiohttp):
+
+    python scripts/nsr_cache_proxy.py --port 8765 --ttl 21600
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import logging
+import time
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, web
+
+_LOGGER = logging.getLogger("nsr_cache_proxy")
+
+SEARCH_PATH = "/api/wastecalendar/search"
+
+
+@dataclass(slots=True)
+class _Entry:
+    body: bytes
+    content_type: str
+    fetched_at: float
+
+
+class _UpstreamError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class CachingProxy:
+    def __init__(self, *, upstream: str, ttl: float, max_stale: float, max_entries: int) -> None:
+        self._upstream = upstream.rstrip("/")
+        self._ttl = ttl
+        self._max_stale = max_stale
+        self._max_entries = max_entries
+        self._cache: OrderedDict[str, _Entry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[_Entry]] = {}
+        self._session: ClientSession | None = None
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "stale": 0, "errors": 0}
+
+    async def start(self, _app: web.Application) -> None:
+        self._session = ClientSession(
+            timeout=ClientTimeout(total=30, connect=10, sock_read=20),
+            headers={"Accept-Encoding": "gzip, deflate", "User-Agent": "binday_sweden-cache-proxy"},
+        )
+
+    async def stop(self, _app: web.Application) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+    async def handle_search(self, request: web.Request) -> web.Response:
+        query = request.query.get("query", "")
+        key = " ".join(query.casefold().split())
+        now = time.monotonic()
+
+        entry = self._cache.get(key)
+        if entry is not None and now - entry.fetched_at < self._ttl:
+            self._cache.move_to_end(key)
+            self.stats["hits"] += 1
+            return self._response(entry, "HIT")
+
+        try:
+            fresh = await self._async_fetch_coalesced(key, query)
+        except _UpstreamError as err:
+            self.stats["errors"] += 1
+            if entry is not None and now - entry.fetched_at < self._max_stale:
+                self.stats["stale"] += 1
+                _LOGGER.warning("Upstream failed for %r (%s); serving stale", query, err)
+                return self._response(entry, "STALE")
+            return web.Response(status=err.status, text=str(err))
+        return self._response(fresh, "MISS")
+
+    async def handle_stats(self, _request: web.Request) -> web.Response:
+        return web.json_response({**self.stats, "entries": len(self._cache), "inflight": len(self._inflight)})
+
+    async def _async_fetch_coalesced(self, key: str, query: str) -> _Entry:
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.stats["misses"] += 1
+        try:
+            entry = await self._async_fetch_upstream(query)
+        except BaseException as err:
+            # Followers wait on this future, so resolve it whatever went wrong.
+            # A cancelled leader (client gone, shutdown) is an upstream error
+            # for them: they get a stale entry or a 503, not a cancellation.
+            if isinstance(err, asyncio.CancelledError):
+                future.set_exception(_UpstreamError(503, "Upstream request was cancelled"))
+            else:
+                future.set_exception(err)
+            # Mark the exception as retrieved when nobody else was waiting.
+            future.exception()
+            raise
+        else:
+            future.set_result(entry)
+            self._store(key, entry)
+            return entry
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _async_fetch_upstream(self, query: str) -> _Entry:
+        assert self._session is not None
+        url = f"{self._upstream}{SEARCH_PATH}"
+        try:
+            async with self._session.get(url, params={"query": query}) as resp:
+                body = await resp.read()
+                if resp.status >= 400:
+                    raise _UpstreamError(resp.status, f"Upstream HTTP {resp.status}")
+                return _Entry(
+                    body=body,
+                    content_type=resp.headers.get("Content-Type", "application/json"),
+                    fetched_at=time.monotonic(),
+                )
+        except (ClientError, TimeoutError) as err:
+            raise _UpstreamError(502, f"Upstream unreachable: {err}") from err
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _response(entry: _Entry, status: str) -> web.Response:
+        age = int(time.monotonic() - entry.fetched_at)
+        return web.Response(
+            body=entry.body,
+            headers={"Content-Type": entry.content_type, "X-Cache": status, "Age": str(age)},
+        )
+
+
+def build_app(proxy: CachingProxy) -> web.Application:
+    app = web.Application()
+    app.router.add_get(SEARCH_PATH, proxy.handle_search)
+    app.router.add_get("/stats", proxy.handle_stats)
+    app.on_startup.append(proxy.start)
+    app.on_cleanup.append(proxy.stop)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--upstream", default="https://nsr.se", help="upstream base URL")
+    parser.add_argument("--ttl", type=float, default=6 * 3600, help="cache TTL in seconds")
+    parser.add_argument(
+        "--max-stale", type=float, default=7 * 24 * 3600, help="max age served on upstream failure"
+    )
+    parser.add_argument("--max-entries", type=int, default=50_000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    proxy = CachingProxy(
+        upstream=args.upstream,
+        ttl=args.ttl,
+        max_stale=args.max_stale,
+        max_entries=args.max_entries,
+    )
+    web.run_app(build_app(proxy), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
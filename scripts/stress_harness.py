@@ -0,0 +1,326 @@
+"""Event-loop stress harness for BinDay Sweden.
+
+Spins up N config entries (coordinator + sensor/binary_sensor platforms) in a
+single Home Assistant process and measures how the integration scales.
+
+Providers are not patched: entries run in cassette replay mode against a
+synthetic cassette written to a throwaway config dir, so the real provider,
+coordinator and entity code paths are exercised without network access.
+
+Usage (from a venv with homeassistant installed):
+
+    python scripts/stress_harness.py --sizes 1,10,100,1000 --output report.json
+
+The JSON report has sorted keys and no timestamps, so reports from two
+versions can be diffed directly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import date, timedelta
+import gzip
+import inspect
+import json
+import os
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from homeassistant import config_entries, loader
+from homeassistant.const import EVENT_STATE_CHANGED, __version__ as HA_VERSION
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+COMPONENT_DIR = REPO_ROOT / "custom_components" / "binday_sweden"
+
+sys.path.insert(0, str(REPO_ROOT))
+
+from custom_components.binday_sweden.const import (  # noqa: E402
+    CONF_ADDRESS_QUERY,
+    CONF_CASSETTE_MODE,
+    CONF_KOMMUN,
+    CONF_LAN,
+    CONF_MATCH_ID,
+    CONF_MATCH_LABEL,
+    CONF_REPLAY_LATENCY_MS,
+    CONF_SCAN_INTERVAL_HOURS,
+    DOMAIN,
+)
+from custom_components.binday_sweden.providers.cassette import (  # noqa: E402
+    CASSETTE_FILENAME,
+    async_get_cassette,
+)
+
+_LAG_INTERVAL = 0.01
+
+_TYPES = (
+    ("KÄRL 1", "Mat+Rest", 14),
+    ("KÄRL 2", "Förpackningar", 28),
+    ("TRÄDGÅRD", "Trädgårdsavfall", 14),
+)
+
+
+def _synthetic_item(index: int, today: date, days: int) -> dict:
+    dates: list[str] = []
+    types_raw: list[str] = []
+    types_formatted: list[str] = []
+    for type_raw, type_formatted, period in _TYPES:
+        offset = index % period
+        for d in range(offset, days, period):
+            dates.append((today + timedelta(days=d)).isoformat())
+            types_raw.append(type_raw)
+            types_formatted.append(type_formatted)
+    return {
+        "id": f"stress-{index}",
+        "Adress": f"Stressgatan {index}",
+        "Ort": "Helsingborg",
+        "Exec": {
+            "Datum": dates,
+            "AvfallsTyp": types_raw,
+            "AvfallsTypFormaterat": types_formatted,
+            "DatumFormaterat": dates,
+        },
+    }
+
+
+def _write_cassette(config_dir: Path, count: int, days: int) -> None:
+    today = date.today()
+    entries = {
+        f"nsr:stressgatan {i}": {"q": f"Stressgatan {i}", "fp": [_synthetic_item(i, today, days)]}
+        for i in range(count)
+    }
+    with gzip.open(config_dir / CASSETTE_FILENAME, "wt", encoding="utf-8") as fh:
+        json.dump({"version": 1, "entries": entries}, fh, ensure_ascii=False)
+
+
+def _make_entry(index: int, latency_ms: int) -> config_entries.ConfigEntry:
+    # ConfigEntry's constructor grows keyword-only fields between HA releases;
+    # pass only the ones this version accepts.
+    kwargs = {
+        "version": 1,
+        "minor_version": 1,
+        "domain": DOMAIN,
+        "title": f"Stress {index}",
+        "data": {
+            CONF_LAN: "Skåne län",
+            CONF_KOMMUN: "Helsingborg",
+            CONF_ADDRESS_QUERY: f"Stressgatan {index}",
+            CONF_MATCH_ID: f"stress-{index}",
+            CONF_MATCH_LABEL: f"Stressgatan {index}, Helsingborg",
+            CONF_SCAN_INTERVAL_HOURS: 12,
+        },
+        "options": {CONF_CASSETTE_MODE: "replay", CONF_REPLAY_LATENCY_MS: latency_ms},
+        "source": config_entries.SOURCE_USER,
+        "unique_id": f"stress-{index}",
+        "discovery_keys": {},
+        "subentries_data": None,
+    }
+    accepted = inspect.signature(config_entries.ConfigEntry.__init__).parameters
+    return config_entries.ConfigEntry(**{k: v for k, v in kwargs.items() if k in accepted})
+
+
+class _LagMonitor:
+    """Sample event-loop lag by measuring sleep overshoot."""
+
+    def __init__(self) -> None:
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(_LAG_INTERVAL)
+            self.samples.append(max(loop.time() - start - _LAG_INTERVAL, 0.0))
+
+    def start(self) -> None:
+        self.samples.clear()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> dict[str, float]:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if not self.samples:
+            return {"max_ms": 0.0, "p95_ms": 0.0, "mean_ms": 0.0}
+        ordered = sorted(self.samples)
+        return {
+            "max_ms": round(ordered[-1] * 1000, 2),
+            "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))] * 1000, 2),
+            "mean_ms": round(statistics.fmean(ordered) * 1000, 2),
+        }
+
+
+def _db_bytes(config_dir: Path) -> int:
+    return sum(
+        p.stat().st_size for p in config_dir.glob("stress.db*") if p.is_file()
+    )
+
+
+async def _async_process_core_config(hass: HomeAssistant) -> None:
+    try:
+        from homeassistant.core_config import async_process_ha_core_config
+    except ImportError:  # older HA releases
+        from homeassistant.config import async_process_ha_core_config
+    await async_process_ha_core_config(
+        hass,
+        {"latitude": 56.046, "longitude": 12.694, "time_zone": "Europe/Stockholm", "unit_system": "metric"},
+    )
+
+
+async def _async_run_size(count: int, args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory(prefix="binday_stress_") as tmp:
+        config_dir = Path(tmp)
+        (config_dir / "custom_components").mkdir()
+        os.symlink(COMPONENT_DIR, config_dir / "custom_components" / DOMAIN)
+        _write_cassette(config_dir, count, args.days)
+
+        hass = HomeAssistant(str(config_dir))
+        if hasattr(loader, "async_setup"):
+            loader.async_setup(hass)
+        await _async_process_core_config(hass)
+        await hass.config_entries.async_initialize()
+
+        if args.recorder:
+            await async_setup_component(
+                hass,
+                "recorder",
+                {"recorder": {"db_url": f"sqlite:///{config_dir / 'stress.db'}", "commit_interval": 1}},
+            )
+        await async_setup_component(hass, "homeassistant", {})
+
+        state_writes = 0
+
+        @callback
+        def _count(_event) -> None:
+            nonlocal state_writes
+            state_writes += 1
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _count)
+
+        # Load the synthetic cassette up front so it is not counted as per-entry memory.
+        await async_get_cassette(hass, config_dir / CASSETTE_FILENAME)
+
+        monitor = _LagMonitor()
+        db_before = _db_bytes(config_dir)
+        tracemalloc.start()
+        mem_before = tracemalloc.take_snapshot()
+
+        # Setup phase: entries are set up concurrently, as HA does on startup.
+        monitor.start()
+        started = time.perf_counter()
+        entries = [_make_entry(i, args.latency_ms) for i in range(count)]
+        await asyncio.gather(*(hass.config_entries.async_add(e) for e in entries))
+        await hass.async_block_till_done()
+        setup_s = time.perf_counter() - started
+        setup_lag = await monitor.stop()
+        setup_writes = state_writes
+
+        mem_after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        mem_bytes = sum(s.size_diff for s in mem_after.compare_to(mem_before, "filename"))
+
+        # Refresh phase: every coordinator refreshes at once.
+        coordinators = list(hass.data.get(DOMAIN, {}).values())
+        state_writes = 0
+        monitor.start()
+        started = time.perf_counter()
+        await asyncio.gather(*(c.async_refresh() for c in coordinators))
+        await hass.async_block_till_done()
+        refresh_s = time.perf_counter() - started
+        refresh_lag = await monitor.stop()
+        refresh_writes = state_writes
+
+        recorder_bytes = None
+        if args.recorder:
+            from homeassistant.components.recorder import get_instance
+
+            await get_instance(hass).async_block_till_done()
+            recorder_bytes = _db_bytes(config_dir) - db_before
+
+        loaded = sum(
+            1
+            for e in hass.config_entries.async_entries(DOMAIN)
+            if e.state is config_entries.ConfigEntryState.LOADED
+        )
+        entities = len(hass.states.async_entity_ids())
+
+        await hass.async_stop(force=True)
+
+    return {
+        "entries": count,
+        "entries_loaded": loaded,
+        "entities": entities,
+        "setup_wall_s": round(setup_s, 3),
+        "setup_loop_lag": setup_lag,
+        "setup_state_writes": setup_writes,
+        "refresh_wall_s": round(refresh_s, 3),
+        "refresh_loop_lag": refresh_lag,
+        "refresh_state_writes": refresh_writes,
+        "memory_per_entry_bytes": int(mem_bytes / max(count, 1)),
+        "recorder_bytes": recorder_bytes,
+    }
+
+
+def _print_table(rows: list[dict]) -> None:
+    header = (
+        f"{'N':>6} {'setup s':>9} {'refresh s':>10} {'lag max ms':>11} "
+        f"{'writes':>8} {'mem/entry':>10} {'db bytes':>10}"
+    )
+    print(header)
+    for r in rows:
+        print(
+            f"{r['entries']:>6} {r['setup_wall_s']:>9} {r['refresh_wall_s']:>10} "
+            f"{max(r['setup_loop_lag']['max_ms'], r['refresh_loop_lag']['max_ms']):>11} "
+            f"{r['refresh_state_writes']:>8} {r['memory_per_entry_bytes']:>10} "
+            f"{r['recorder_bytes'] or '-':>10}"
+        )
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    manifest = json.loads((COMPONENT_DIR / "manifest.json").read_text(encoding="utf-8"))
+    rows = []
+    for size in args.sizes:
+        rows.append(await _async_run_size(size, args))
+    report = {
+        "homeassistant_version": HA_VERSION,
+        "integration_version": manifest.get("version"),
+        "params": {"days": args.days, "latency_ms": args.latency_ms, "recorder": args.recorder},
+        "results": rows,
+    }
+    _print_table(rows)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda v: [int(x) for x in v.split(",") if x],
+        default=[1, 10, 100, 1000],
+        help="comma-separated entry counts (default: 1,10,100,1000)",
+    )
+    parser.add_argument("--days", type=int, default=90, help="synthetic schedule length in days")
+    parser.add_argument("--latency-ms", type=int, default=0, help="simulated provider latency")
+    parser.add_argument(
+        "--no-recorder",
+        dest="recorder",
+        action="store_false",
+        help="skip recorder measurements",
+    )
+    parser.add_argument("--output", help="write the JSON report to this path")
+    asyncio.run(_async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()